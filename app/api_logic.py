@@ -1,16 +1,90 @@
+import copy
+import functools
 import json
-from datetime import datetime
-from typing import Dict, Any, Union, List
+from datetime import date, datetime
+from typing import Dict, Any, Union, List, Tuple
+
+import orjson
 
 # Imports from Core Modules
 from app.core.gps_resolver import GPSResolver
 from app.core.stcr_fertilizer import calculate_fertilizer
 from app.core.lime_calculator import calculate_lime
-from app.core.farmer_view import simplify_advisory
+from app.core.farmer_view import simplify_advisory, parse_sowing_date
 
 # Initialize Resolver (relies on default path logic in GPSResolver)
 resolver = GPSResolver()
 
+# Status/texture translations shared by every response (read-only)
+_LOCALIZE: Dict[str, Dict[str, str]] = {
+    "low": {"en": "Low", "kn": "ಕಡಿಮೆ"},
+    "medium": {"en": "Medium", "kn": "ಮಧ್ಯಮ"},
+    "high": {"en": "High", "kn": "ಹೆಚ್ಚು"},
+    "acidic": {"en": "Acidic", "kn": "ಆಮ್ಲೀಯ"},
+    "neutral": {"en": "Neutral", "kn": "ತಟಸ್ಥ"},
+    "alkaline": {"en": "Alkaline", "kn": "ಕ್ಷಾರೀಯ"},
+    "sandy": {"en": "Sandy", "kn": "ಮರಳು ಮಿಶ್ರಿತ"},
+    "clay_loam": {"en": "Clay Loam", "kn": "ಜೇಡಿ ಮಣ್ಣು"},
+    "lateritic": {"en": "Lateritic", "kn": "ಕೆಂಪು ಮಣ್ಣು"},
+    "Deficient": {"en": "Deficient", "kn": "ಕೊರತೆ ಇದೆ"},
+    "Sufficient": {"en": "Sufficient", "kn": "ಸಾಕಷ್ಟು ಇದೆ"},
+    "Unknown": {"en": "Unknown", "kn": "ಗೊತ್ತಿಲ್ಲ"},
+    "Moderate": {"en": "Moderate", "kn": "ಮಧ್ಯಮ"},
+    "Excellent": {"en": "Excellent", "kn": "ಅತ್ಯುತ್ತಮ"},
+    "Good": {"en": "Good", "kn": "ಉತ್ತಮ"}
+}
+
+# (epoch_day, "YYYY-MM-DD") for the default sowing date
+_today_cache = [None, None]
+
+def _today_str() -> str:
+    """Today's local date as YYYY-MM-DD, rebuilt only when the day rolls over."""
+    today = date.today()
+    if _today_cache[0] != today:
+        _today_cache[1] = today.isoformat()
+        _today_cache[0] = today
+    return _today_cache[1]
+
+# Constant parts of the response. flatten_localization() always builds
+# new containers, so these are never handed out to callers directly.
+_WHC_MAP: Dict[str, Dict[str, str]] = {
+    "sandy": _LOCALIZE["low"],
+    "lateritic": _LOCALIZE["medium"],
+    "clay_loam": _LOCALIZE["high"]
+}
+
+_FERT_NAMES: Dict[str, Dict[str, str]] = {
+    "urea": {"en": "Urea", "kn": "ಯೂರಿಯಾ"},
+    "dap": {"en": "DAP", "kn": "ಡಿ.ಎ.ಪಿ"},
+    "mop": {"en": "MOP", "kn": "ಪೊಟ್ಯಾಷ್"}
+}
+
+_FERT_METHODS: Dict[str, Dict[str, str]] = {
+    "urea": {"en": "Broadcasting in split doses", "kn": "ಕಂತುಗಳಲ್ಲಿ ಮೇಲೆರಚುವುದು"},
+    "dap": {"en": "Basal application at sowing", "kn": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ ಅಡಿಗೊಬ್ಬರವಾಗಿ"},
+    "mop": {"en": "Basal and top dressing", "kn": "ಅಡಿಗೊಬ್ಬರ ಮತ್ತು ಮೇಲುಗೊಬ್ಬರವಾಗಿ"}
+}
+
+_ORGANIC_AMENDMENT: Dict[str, Dict[str, str]] = {
+    "type": {"en": "Farm Yard Manure (FYM)", "kn": "ಕೊಟ್ಟಿಗೆ ಗೊಬ್ಬರ"},
+    "quantity": {"en": "10-12 tons/ha", "kn": "10-12 ಟನ್/ಹೆಕ್ಟೇರ್"},
+    "method": {"en": "Incorporate during final ploughing", "kn": "ಕೊನೆಯ ಉಳಿಮೆಯ ಸಮಯದಲ್ಲಿ ಮಣ್ಣಿಗೆ ಸೇರಿಸಿ"}
+}
+
+_PH_CORRECTION_METHOD = {"en": "Apply 2 weeks before sowing", "kn": "ಬಿತ್ತನೆಗೆ 2 ವಾರ ಮೊದಲು ಮಣ್ಣಿಗೆ ಸೇರಿಸಿ"}
+_SEVERITY_HIGH = _LOCALIZE["high"]
+_SEVERITY_MODERATE = _LOCALIZE["Moderate"]
+
+# Fixed validation errors, pre-encoded so the HTTP layer can reject
+# bad payloads without running the encoder
+_ERR_INVALID_SOIL = "Invalid numeric values in Soil Data"
+_ERR_INVALID_COORDS = "Invalid Latitude/Longitude"
+_ERR_MISSING_DATA = "Missing Soil Data or GPS Coordinates"
+_ERROR_BODIES: Dict[str, bytes] = {
+    msg: orjson.dumps({"error": msg})
+    for msg in (_ERR_INVALID_SOIL, _ERR_INVALID_COORDS, _ERR_MISSING_DATA)
+}
+
 def flatten_localization(data: Any, lang: str = "en") -> Any:
     """
     Recursively flattens dictionaries containing 'en' and 'kn' keys 
@@ -28,19 +102,34 @@ def flatten_localization(data: Any, lang: str = "en") -> Any:
     return data
 
 
-def generate_physical_advice(profile: Dict) -> Dict:
-    """
-    Generates advice on Moisture, Drainage, and Erosion based on soil physics.
-    """
-    texture = profile.get("texture", "lateritic")
-    topo = profile.get("topography", "Upland")
-    
-    advice = {
-        "moisture": {"en": "Moderate retention.", "kn": "ಮಧ್ಯಮ ತೇವಾಂಶ ಧಾರಣ."},
-        "drainage": {"en": "Well drained.", "kn": "ಉತ್ತಮ ಬಸಿಯುವಿಕೆ."},
-        "erosion": {"en": "Low risk.", "kn": "ಕಡಿಮೆ ಸವೆತ."},
-        "suitability": {"en": "Suitable for most crops.", "kn": "ಹೆಚ್ಚಿನ ಬೆಳೆಗಳಿಗೆ ಸೂಕ್ತ."}
+# Defaults before texture/topography rules are applied
+_BASE_PHYSICAL_ADVICE: Dict[str, Dict[str, str]] = {
+    "moisture": {"en": "Moderate retention.", "kn": "ಮಧ್ಯಮ ತೇವಾಂಶ ಧಾರಣ."},
+    "drainage": {"en": "Well drained.", "kn": "ಉತ್ತಮ ಬಸಿಯುವಿಕೆ."},
+    "erosion": {"en": "Low risk.", "kn": "ಕಡಿಮೆ ಸವೆತ."},
+    "suitability": {"en": "Suitable for most crops.", "kn": "ಹೆಚ್ಚಿನ ಬೆಳೆಗಳಿಗೆ ಸೂಕ್ತ."}
+}
+
+# Seasonal tips are the same for every request (shared, do not mutate)
+_MGMT_TIPS: List[Dict[str, str]] = [
+    {
+        "en": "🚜 Pre-Sowing: Plough 15cm deep to break hard pans.",
+        "kn": "🚜 ಬಿತ್ತನೆಗೆ ಮುನ್ನ: ಗಟ್ಟಿಯಾದ ಮಣ್ಣನ್ನು ಒಡೆಯಲು 15 ಸೆಂ.ಮೀ ಆಳವಾಗಿ ಉಳಿಮೆ ಮಾಡಿ."
+    },
+    {
+        "en": "🌿 Organic: Apply Green Manure (Daincha) 2 weeks before planting.",
+        "kn": "🌿 ಸಾವಯವ: ಬಿತ್ತನೆಗೆ 2 ವಾರಗಳ ಮೊದಲು ಹಸಿರೆಲೆ ಗೊಬ್ಬರ ಹಾಕಿ."
+    },
+    {
+        "en": "💧 Post-Harvest: Retain stubble to improve soil carbon.",
+        "kn": "💧 ಕಟಾವಿನ ನಂತರ: ಮಣ್ಣಿನ ಇಂಗಾಲ ಹೆಚ್ಚಿಸಲು ಕೂಳೆಗಳನ್ನು ಉಳಿಸಿ."
     }
+]
+
+
+def _build_physical_advice(texture: str, topo: str) -> Dict:
+    # Rules below replace whole entries, so a shallow copy is enough
+    advice = dict(_BASE_PHYSICAL_ADVICE)
     
     # 1. Texture Rules
     if texture == "sandy":
@@ -59,6 +148,27 @@ def generate_physical_advice(profile: Dict) -> Dict:
         
     return advice
 
+# Every (texture, topography) outcome, precomputed. None = "any other value".
+_PHYSICAL_TEXTURES = ("sandy", "clay_loam")
+_PHYSICAL_TOPOS = ("Upland", "Lowland")
+_PHYSICAL_ADVICE: Dict[Tuple[Any, Any], Dict[str, Dict[str, str]]] = {
+    (tex, topo): _build_physical_advice(tex, topo)
+    for tex in _PHYSICAL_TEXTURES + (None,)
+    for topo in _PHYSICAL_TOPOS + (None,)
+}
+
+def generate_physical_advice(profile: Dict) -> Dict:
+    """
+    Generates advice on Moisture, Drainage, and Erosion based on soil physics.
+    Returns a shared table entry; callers must not mutate it.
+    """
+    texture = profile.get("texture", "lateritic")
+    topo = profile.get("topography", "Upland")
+    return _PHYSICAL_ADVICE[(
+        texture if texture in _PHYSICAL_TEXTURES else None,
+        topo if topo in _PHYSICAL_TOPOS else None
+    )]
+
 def generate_crop_suitability(profile: Dict, current_crop: str) -> Dict:
     """
     Evaluates if the soil is suitable for the current crop.
@@ -92,41 +202,117 @@ def generate_management_tips(sowing_date: str) -> List[Dict[str, str]]:
     """
     Generates seasonal soil management tips.
     """
-    return [
-        {
-            "en": "🚜 Pre-Sowing: Plough 15cm deep to break hard pans.",
-            "kn": "🚜 ಬಿತ್ತನೆಗೆ ಮುನ್ನ: ಗಟ್ಟಿಯಾದ ಮಣ್ಣನ್ನು ಒಡೆಯಲು 15 ಸೆಂ.ಮೀ ಆಳವಾಗಿ ಉಳಿಮೆ ಮಾಡಿ."
-        },
-        {
-            "en": "🌿 Organic: Apply Green Manure (Daincha) 2 weeks before planting.",
-            "kn": "🌿 ಸಾವಯವ: ಬಿತ್ತನೆಗೆ 2 ವಾರಗಳ ಮೊದಲು ಹಸಿರೆಲೆ ಗೊಬ್ಬರ ಹಾಕಿ."
-        },
-        {
-            "en": "💧 Post-Harvest: Retain stubble to improve soil carbon.",
-            "kn": "💧 ಕಟಾವಿನ ನಂತರ: ಮಣ್ಣಿನ ಇಂಗಾಲ ಹೆಚ್ಚಿಸಲು ಕೂಳೆಗಳನ್ನು ಉಳಿಸಿ."
-        }
-    ]
+    return _MGMT_TIPS
 
-def _get_status(val: Any, nutrient: str) -> str:
-    # Helper remains same, output is localized in process_request
+# Lab thresholds (kg/ha): below low -> "low", above high -> "high"
+_STATUS_BINS = {
+    "n": (280, 560),
+    "p": (22, 55),
+    "k": (140, 330),
+}
+_LEVELS = ("low", "medium", "high")
+
+def _safe_float(val: Any, default: Any = 0.0) -> Any:
+    """Coerce to float, returning default for missing or non-numeric input."""
+    if type(val) is float:
+        return val
+    if type(val) is int:
+        return float(val)
     try:
-        val = float(val)
+        return float(val)
     except (ValueError, TypeError):
+        return default
+
+def _get_status(val: Any, nutrient: str) -> str:
+    # Helper remains same, output is localized in process_request
+    val = _safe_float(val, None)
+    if val is None:
         return "medium"
-        
-    if nutrient == "n":
-        return "low" if val < 280 else "high" if val > 560 else "medium"
-    elif nutrient == "p":
-        return "low" if val < 22 else "high" if val > 55 else "medium"
-    elif nutrient == "k":
-        return "low" if val < 140 else "high" if val > 330 else "medium"
-    return "medium"
+
+    bins = _STATUS_BINS.get(nutrient)
+    if bins is None:
+        return "medium"
+    # Index into _LEVELS: 0 below range, 2 above range, 1 otherwise (incl. NaN)
+    return _LEVELS[1 + (val > bins[1]) - (val < bins[0])]
+
+def _get_statuses(n: Any, p: Any, k: Any) -> Tuple[str, str, str]:
+    """Classify lab N, P, K values in one call."""
+    return _get_status(n, "n"), _get_status(p, "p"), _get_status(k, "k")
+
+# Request fields _process_request reads (besides lat/lon); the cache key
+# ignores everything else, so padded payloads can't make keys unique
+_KEY_FIELDS = (
+    "crop", "language", "ph", "nitrogen_kg_ha", "phosphorus_kg_ha", "potassium_kg_ha",
+    "texture", "organic_carbon", "zinc_ppm", "land_type", "sowing_date"
+)
+_KEY_SCALARS = (str, int, float, bool, type(None))
+_MAX_KEY_STR_LEN = 64  # Real values (crop, dates, textures) are short
+
+def _payload_key(request_json: Any) -> Any:
+    """
+    Hashable key of the normalized fields the pipeline reads, or None if the
+    payload can't be keyed (non-scalar or oversized values).
+    Entries are (field, type, value) so 1, 1.0 and True stay distinct.
+    """
+    if not isinstance(request_json, dict):
+        return None
+    lat = request_json.get("lat") or request_json.get("latitude")
+    lon = request_json.get("lon") or request_json.get("longitude")
+    items = [("lat", lat), ("lon", lon)]
+    items.extend((f, request_json[f]) for f in _KEY_FIELDS if f in request_json)
+    key = []
+    for field, val in items:
+        if type(val) not in _KEY_SCALARS or (type(val) is str and len(val) > _MAX_KEY_STR_LEN):
+            return None
+        key.append((field, type(val), val))
+    return tuple(key)
+
+def _payload_from_key(key: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Rebuild the minimal request payload a key stands for."""
+    return {field: val for field, _, val in key}
 
 def process_request(request_json: Dict[str, Any]) -> Dict[str, Any]:
     """
     Main Entry Point for Soil Health and Correction Intelligence.
     Returns structured soil intelligence in English/Kannada.
     """
+    return _process_request(request_json)
+
+class _RejectedPayload(Exception):
+    """Carries an error result out of _encode_request_cached so it isn't cached."""
+
+def _error_body(message: str) -> bytes:
+    """Pre-encoded {"error": message} body; only unexpected messages are encoded."""
+    body = _ERROR_BODIES.get(message)
+    return body if body is not None else orjson.dumps({"error": message})
+
+def process_request_encoded(request_json: Dict[str, Any]) -> Tuple[bool, bytes]:
+    """
+    Like process_request, but returns (ok, JSON bytes) for the HTTP layer.
+    Only successful bodies are cached, per normalized payload and day; error
+    results are never cached and use the pre-encoded error bodies.
+    """
+    key = _payload_key(request_json)
+    if key is None:
+        result = _process_request(request_json)
+        if "error" in result:
+            return False, _error_body(result["error"])
+        return True, orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+    try:
+        # Day key: missing/invalid sowing dates fall back to today's (local) date
+        return True, _encode_request_cached(key, _today_str())
+    except _RejectedPayload as e:
+        return False, _error_body(e.args[0])
+
+@functools.lru_cache(maxsize=4096)
+def _encode_request_cached(key: Tuple[Any, ...], day: str) -> bytes:
+    result = _process_request(_payload_from_key(key))
+    if "error" in result:
+        # lru_cache doesn't store raised calls, so junk payloads can't evict good entries
+        raise _RejectedPayload(result["error"])
+    return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+
+def _process_request(request_json: Dict[str, Any]) -> Dict[str, Any]:
     
     # 1. Parse Inputs
     crop = request_json.get("crop", "Paddy")
@@ -142,9 +328,11 @@ def process_request(request_json: Dict[str, Any]) -> Dict[str, Any]:
         # A. PRECISION MODE (Lab)
         try:
             ph = float(request_json["ph"])
-            n_status = _get_status(request_json["nitrogen_kg_ha"], "n")
-            p_status = _get_status(request_json["phosphorus_kg_ha"], "p")
-            k_status = _get_status(request_json["potassium_kg_ha"], "k")
+            n_status, p_status, k_status = _get_statuses(
+                request_json["nitrogen_kg_ha"],
+                request_json["phosphorus_kg_ha"],
+                request_json["potassium_kg_ha"]
+            )
             soil_type = request_json.get("texture", "lateritic")
             oc_status = request_json.get("organic_carbon", "medium")
             zinc_val = float(request_json.get("zinc_ppm", 0.5))
@@ -157,7 +345,7 @@ def process_request(request_json: Dict[str, Any]) -> Dict[str, Any]:
             profile = {"taluk": "Lab", "zone": "User", "topography": "User", "salinity": "Normal"}
             
         except (ValueError, TypeError):
-             return {"error": "Invalid numeric values in Soil Data"}
+             return {"error": _ERR_INVALID_SOIL}
     
     elif lat is not None and lon is not None:
         # B. GPS MODE
@@ -165,17 +353,14 @@ def process_request(request_json: Dict[str, Any]) -> Dict[str, Any]:
             lat = float(lat)
             lon = float(lon)
         except (ValueError, TypeError):
-            return {"error": "Invalid Latitude/Longitude"}
+            return {"error": _ERR_INVALID_COORDS}
             
         zinc_val = 0.5 
         land_type_input = request_json.get("land_type")
-        sowing_date = request_json.get("sowing_date", datetime.now().strftime("%Y-%m-%d"))
+        sowing_date = request_json.get("sowing_date") or _today_str()
         
-        try:
-            sow_dt = datetime.strptime(sowing_date, "%Y-%m-%d")
-            sow_month = sow_dt.month
-        except:
-            sow_month = datetime.now().month
+        sow_dt = parse_sowing_date(sowing_date)
+        sow_month = sow_dt.month if sow_dt else datetime.now().month
 
         profile = resolver.get_profile(lat, lon, land_type_override=land_type_input, month=sow_month)
         
@@ -195,7 +380,7 @@ def process_request(request_json: Dict[str, Any]) -> Dict[str, Any]:
         s_status = "Deficient" if soil_type == "sandy" else "Sufficient"
             
     else:
-        return {"error": "Missing Soil Data or GPS Coordinates"}
+        return {"error": _ERR_MISSING_DATA}
 
     # 3. Scientific Models
     lime_result = calculate_lime(ph, None, soil_type)
@@ -212,107 +397,122 @@ def process_request(request_json: Dict[str, Any]) -> Dict[str, Any]:
     )
     
     # 4. Translations & Mappings
-    def localize(val: str) -> Dict[str, str]:
-        mappings = {
-            "low": {"en": "Low", "kn": "ಕಡಿಮೆ"},
-            "medium": {"en": "Medium", "kn": "ಮಧ್ಯಮ"},
-            "high": {"en": "High", "kn": "ಹೆಚ್ಚು"},
-            "acidic": {"en": "Acidic", "kn": "ಆಮ್ಲೀಯ"},
-            "neutral": {"en": "Neutral", "kn": "ತಟಸ್ಥ"},
-            "alkaline": {"en": "Alkaline", "kn": "ಕ್ಷಾರೀಯ"},
-            "sandy": {"en": "Sandy", "kn": "ಮರಳು ಮಿಶ್ರಿತ"},
-            "clay_loam": {"en": "Clay Loam", "kn": "ಜೇಡಿ ಮಣ್ಣು"},
-            "lateritic": {"en": "Lateritic", "kn": "ಕೆಂಪು ಮಣ್ಣು"},
-            "Deficient": {"en": "Deficient", "kn": "ಕೊರತೆ ಇದೆ"},
-            "Sufficient": {"en": "Sufficient", "kn": "ಸಾಕಷ್ಟು ಇದೆ"},
-            "Unknown": {"en": "Unknown", "kn": "ಗೊತ್ತಿಲ್ಲ"},
-            "Moderate": {"en": "Moderate", "kn": "ಮಧ್ಯಮ"},
-            "Excellent": {"en": "Excellent", "kn": "ಅತ್ಯುತ್ತಮ"},
-            "Good": {"en": "Good", "kn": "ಉತ್ತಮ"}
-        }
-        return mappings.get(val, {"en": val, "kn": val})
+    suitability = generate_crop_suitability(profile, crop)
 
-    whc_map = {
-        "sandy": {"en": "Low", "kn": "ಕಡಿಮೆ"},
-        "lateritic": {"en": "Medium", "kn": "ಮಧ್ಯಮ"},
-        "clay_loam": {"en": "High", "kn": "ಹೆಚ್ಚು"}
-    }
-    
     # 5. Build Response
     response = {
         "status": "success",
         "soil_profile": {
-            "soil_type": localize(soil_type),
-            "texture_classification": localize(soil_type),
-            "water_holding_capacity": whc_map.get(soil_type, {"en": "Medium", "kn": "ಮಧ್ಯಮ"})
+            "soil_type": _LOCALIZE.get(soil_type, {"en": soil_type, "kn": soil_type}),
+            "texture_classification": _LOCALIZE.get(soil_type, {"en": soil_type, "kn": soil_type}),
+            "water_holding_capacity": _WHC_MAP.get(soil_type, _LOCALIZE["medium"])
         },
         "soil_chemical_properties": {
             "ph_value": ph,
-            "ph_classification": localize("acidic" if ph < 6.0 else "neutral" if ph < 7.5 else "alkaline"),
-            "organic_carbon_status": localize(oc_status)
+            "ph_classification": _LOCALIZE["acidic" if ph < 6.0 else "neutral" if ph < 7.5 else "alkaline"],
+            "organic_carbon_status": _LOCALIZE.get(oc_status, {"en": oc_status, "kn": oc_status})
         },
         "nutrient_status": {
             "primary": {
-                "nitrogen": localize(n_status),
-                "phosphorus": localize(p_status),
-                "potassium": localize(k_status)
+                "nitrogen": _LOCALIZE.get(n_status, {"en": n_status, "kn": n_status}),
+                "phosphorus": _LOCALIZE.get(p_status, {"en": p_status, "kn": p_status}),
+                "potassium": _LOCALIZE.get(k_status, {"en": k_status, "kn": k_status})
             },
             "secondary": {
-                "sulphur": localize(s_status)
+                "sulphur": _LOCALIZE.get(s_status, {"en": s_status, "kn": s_status})
             },
             "micronutrients": {
-                "zinc": localize("Deficient" if zinc_val < 0.6 else "Sufficient"),
-                "iron": localize(fe_status),
-                "boron": localize(b_status),
-                "manganese": localize(mn_status)
+                "zinc": _LOCALIZE["Deficient" if zinc_val < 0.6 else "Sufficient"],
+                "iron": _LOCALIZE.get(fe_status, {"en": fe_status, "kn": fe_status}),
+                "boron": _LOCALIZE.get(b_status, {"en": b_status, "kn": b_status}),
+                "manganese": _LOCALIZE.get(mn_status, {"en": mn_status, "kn": mn_status})
             }
         },
         "deficiency_report": [],
         "soil_correction_recommendations": {
             "recommended_fertilizer": [
                 {
-                    "name": {"en": "Urea", "kn": "ಯೂರಿಯಾ"},
+                    "name": _FERT_NAMES["urea"],
                     "quantity": {"en": f"{stcr_result.urea_kg} kg/ha", "kn": f"{stcr_result.urea_kg} ಕೆ.ಜಿ/ಹೆಕ್ಟೇರ್"},
-                    "method": {"en": "Broadcasting in split doses", "kn": "ಕಂತುಗಳಲ್ಲಿ ಮೇಲೆರಚುವುದು"}
+                    "method": _FERT_METHODS["urea"]
                 },
                 {
-                    "name": {"en": "DAP", "kn": "ಡಿ.ಎ.ಪಿ"},
+                    "name": _FERT_NAMES["dap"],
                     "quantity": {"en": f"{stcr_result.dap_kg} kg/ha", "kn": f"{stcr_result.dap_kg} ಕೆ.ಜಿ/ಹೆಕ್ಟೇರ್"},
-                    "method": {"en": "Basal application at sowing", "kn": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ ಅಡಿಗೊಬ್ಬರವಾಗಿ"}
+                    "method": _FERT_METHODS["dap"]
                 },
                 {
-                    "name": {"en": "MOP", "kn": "ಪೊಟ್ಯಾಷ್"},
+                    "name": _FERT_NAMES["mop"],
                     "quantity": {"en": f"{stcr_result.mop_kg} kg/ha", "kn": f"{stcr_result.mop_kg} ಕೆ.ಜಿ/ಹೆಕ್ಟೇರ್"},
-                    "method": {"en": "Basal and top dressing", "kn": "ಅಡಿಗೊಬ್ಬರ ಮತ್ತು ಮೇಲುಗೊಬ್ಬರವಾಗಿ"}
+                    "method": _FERT_METHODS["mop"]
                 }
             ],
-            "recommended_organic_amendment": {
-                "type": {"en": "Farm Yard Manure (FYM)", "kn": "ಕೊಟ್ಟಿಗೆ ಗೊಬ್ಬರ"},
-                "quantity": {"en": "10-12 tons/ha", "kn": "10-12 ಟನ್/ಹೆಕ್ಟೇರ್"},
-                "method": {"en": "Incorporate during final ploughing", "kn": "ಕೊನೆಯ ಉಳಿಮೆಯ ಸಮಯದಲ್ಲಿ ಮಣ್ಣಿಗೆ ಸೇರಿಸಿ"}
-            },
+            "recommended_organic_amendment": _ORGANIC_AMENDMENT,
             "ph_correction": {
                 "suggestion": {"en": "Apply Dolomite/Lime" if ph < 6.0 else "Not required", "kn": "ಡೋಲೋಮೈಟ್/ಸುಣ್ಣ ಬಳಸಿ" if ph < 6.0 else "ಅಗತ್ಯವಿಲ್ಲ"},
                 "quantity": {"en": f"{lime_t_ha} tons/ha", "kn": f"{lime_t_ha} ಟನ್/ಹೆಕ್ಟೇರ್"} if ph < 6.0 else {"en": "0", "kn": "0"},
-                "method": {"en": "Apply 2 weeks before sowing", "kn": "ಬಿತ್ತನೆಗೆ 2 ವಾರ ಮೊದಲು ಮಣ್ಣಿಗೆ ಸೇರಿಸಿ"}
+                "method": _PH_CORRECTION_METHOD
             }
         },
         "soil_suitability_index": {
-            "score": generate_crop_suitability(profile, crop)["score"],
-            "limiting_factors": [w for w in generate_crop_suitability(profile, crop)["warnings"]]
+            "score": suitability["score"],
+            "limiting_factors": suitability["warnings"]
         }
     }
 
     # Populate deficiency report
-    if n_status == "low": response["deficiency_report"].append({"nutrient": localize("n"), "severity": {"en": "High", "kn": "ಹೆಚ್ಚು"}})
-    if p_status == "low": response["deficiency_report"].append({"nutrient": localize("p"), "severity": {"en": "High", "kn": "ಹೆಚ್ಚು"}})
-    if k_status == "low": response["deficiency_report"].append({"nutrient": localize("k"), "severity": {"en": "High", "kn": "ಹೆಚ್ಚು"}})
-    if zinc_val < 0.6: response["deficiency_report"].append({"nutrient": localize("zinc"), "severity": {"en": "Moderate", "kn": "ಮಧ್ಯಮ"}})
-    if s_status == "Deficient": response["deficiency_report"].append({"nutrient": localize("sulphur"), "severity": {"en": "Moderate", "kn": "ಮಧ್ಯಮ"}})
-    if b_status == "Deficient": response["deficiency_report"].append({"nutrient": localize("boron"), "severity": {"en": "Moderate", "kn": "ಮಧ್ಯಮ"}})
+    if n_status == "low": response["deficiency_report"].append({"nutrient": {"en": "n", "kn": "n"}, "severity": _SEVERITY_HIGH})
+    if p_status == "low": response["deficiency_report"].append({"nutrient": {"en": "p", "kn": "p"}, "severity": _SEVERITY_HIGH})
+    if k_status == "low": response["deficiency_report"].append({"nutrient": {"en": "k", "kn": "k"}, "severity": _SEVERITY_HIGH})
+    if zinc_val < 0.6: response["deficiency_report"].append({"nutrient": {"en": "zinc", "kn": "zinc"}, "severity": _SEVERITY_MODERATE})
+    if s_status == "Deficient": response["deficiency_report"].append({"nutrient": {"en": "sulphur", "kn": "sulphur"}, "severity": _SEVERITY_MODERATE})
+    if b_status == "Deficient": response["deficiency_report"].append({"nutrient": {"en": "boron", "kn": "boron"}, "severity": _SEVERITY_MODERATE})
     
     return flatten_localization(response, language)
 
+def _process_batch_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one batch item; a failing item becomes {"error": msg} instead of failing the batch."""
+    try:
+        return _process_request(item)
+    except (ValueError, KeyError) as e:
+        return {"error": str(e)}
+
+def process_request_batch(requests_json: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Process many payloads in order. Identical payloads are computed once and
+    every other slot gets its own deep copy, so results stay independent.
+    A failing item (e.g. unknown crop) gets {"error": msg} in its slot.
+    """
+    results: List[Any] = [None] * len(requests_json)
+    groups: Dict[Any, List[int]] = {}
+    for i, item in enumerate(requests_json):
+        if not isinstance(item, dict):
+            results[i] = {"error": "Invalid request item"}
+            continue
+        key = _payload_key(item)
+        if key is None:
+            results[i] = _process_batch_item(item)
+        else:
+            groups.setdefault(key, []).append(i)
+
+    for idxs in groups.values():
+        result = _process_batch_item(requests_json[idxs[0]])
+        results[idxs[0]] = result
+        for i in idxs[1:]:
+            results[i] = copy.deepcopy(result)
+    return results
+
+def warmup() -> None:
+    """
+    Run one GPS and one lab request so first-call costs are paid up front.
+    Resolver, bag and stage caches are only filled for the warm-up inputs.
+    """
+    for payload in (
+        {"lat": 13.3409, "lon": 74.7421, "crop": "Paddy", "sowing_date": "2026-06-15"},
+        {"ph": 5.5, "nitrogen_kg_ha": 300, "phosphorus_kg_ha": 30, "potassium_kg_ha": 200, "crop": "Paddy"},
+    ):
+        _process_request(payload)
+
 # Test
 if __name__ == "__main__":
     test_payload = {
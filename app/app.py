@@ -1,11 +1,32 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_compress import Compress
-from app.api_logic import process_request
+from werkzeug.exceptions import RequestEntityTooLarge
+from app.api_logic import process_request_batch, process_request_encoded
+import orjson
 import os
 
+class OrjsonProvider(JSONProvider):
+    """orjson-backed JSON provider (native UTF-8, much faster on Kannada text)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024  # Advisory payloads are < 1 KB
 Compress(app)
 
+MAX_BATCH_SIZE = 50
+
+def _read_json_body():
+    """Parse the POST body as JSON regardless of Content-Type (like force=True)."""
+    raw = request.get_data(cache=False)
+    return orjson.loads(raw) if raw else None
+
 @app.route('/', methods=['GET'])
 def health_check():
     return jsonify({"status": "healthy", "service": "GrowMate Soil Advisory"}), 200
@@ -13,18 +34,41 @@ def health_check():
 @app.route('/api/advisory', methods=['POST'])
 def advisory():
     try:
-        data = request.get_json(force=True)
+        data = _read_json_body()
         if not data:
             return jsonify({"status": "error", "message": "No JSON payload provided"}), 400
             
-        result = process_request(data)
+        ok, body = process_request_encoded(data)
         
-        status_code = 200
-        if result.get("status") == "error":
-            status_code = 400
+        # Error results keep their {"error": msg} body, same as batch items
+        status_code = 200 if ok else 400
             
-        return jsonify(result), status_code
+        return app.response_class(body, status=status_code, mimetype="application/json")
         
+    except orjson.JSONDecodeError:
+        return jsonify({"status": "error", "message": "Invalid JSON payload"}), 400
+    except RequestEntityTooLarge:
+        return jsonify({"status": "error", "message": "Payload too large"}), 413
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+@app.route('/api/advisory/batch', methods=['POST'])
+def advisory_batch():
+    try:
+        data = _read_json_body()
+        if not isinstance(data, dict) or not isinstance(data.get("requests"), list):
+            return jsonify({"status": "error", "message": "Expected JSON object with a 'requests' list"}), 400
+        if len(data["requests"]) > MAX_BATCH_SIZE:
+            return jsonify({"status": "error", "message": f"Batch limited to {MAX_BATCH_SIZE} requests"}), 400
+
+        results = process_request_batch(data["requests"])
+
+        return jsonify({"status": "success", "results": results}), 200
+
+    except orjson.JSONDecodeError:
+        return jsonify({"status": "error", "message": "Invalid JSON payload"}), 400
+    except RequestEntityTooLarge:
+        return jsonify({"status": "error", "message": "Payload too large"}), 413
     except Exception as e:
         return jsonify({"status": "error", "message": str(e)}), 500
 
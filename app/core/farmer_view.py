@@ -12,9 +12,13 @@ Includes:
 "Think like a farmer, verify like a scientist."
 """
 
+import functools
+import re
+import sys
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Tuple, FrozenSet
+from datetime import date, datetime
 
 # =============================================================================
 # CONSTANTS & CONFIGURATION
@@ -37,6 +41,14 @@ BAG_SIZES = {
     "magnesium_sulfate": 25,
 }
 
+# Per-hectare doses are divided by this to get per-acre doses
+ACRE_FACTOR = 2.5
+
+# Nutrient fraction of each product (Urea 46% N, DAP 46% P2O5, MOP 60% K2O)
+UREA_N_FRACTION = 0.46
+DAP_P_FRACTION = 0.46
+MOP_K_FRACTION = 0.60
+
 # Structured Names
 LOCAL_NAMES = {
     "urea": {"en": "Urea", "kn": "ಯೂರಿಯಾ"},
@@ -53,7 +65,7 @@ LOCAL_NAMES = {
 # DATA STRUCTURES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShoppingItem:
     product_name: str
     product_en: str
@@ -63,7 +75,7 @@ class ShoppingItem:
     loose_kg: float
     bag_size: int
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScheduleItem:
     stage_name: str
     stage_kannada: str
@@ -73,7 +85,7 @@ class ScheduleItem:
     products_kn: List[str]
     instructions: Dict[str, str] # {en:.., kn:..}
 
-@dataclass
+@dataclass(slots=True)
 class FarmerAdvisory:
     crop_name: str
     sowing_date: str
@@ -86,6 +98,8 @@ class FarmerAdvisory:
     substitutes: List[Dict[str, str]]
     voice_script: str
     manure_credit_msg: Dict[str, str]
+    # Warning markers ("lime", "critical") so consumers needn't rescan text
+    flags: FrozenSet[str] = frozenset()
 
 # ... (Colloquial Units & Mixing Guide omitted for brevity, logic remains similar but localized)
 
@@ -111,50 +125,67 @@ def get_colloquial_measure(product: str, kg_amount: float) -> Dict[str, str]:
     # For now returning simple string, ideally should be structured.
     return {"en": f"{kg_amount} kg", "kn": f"{kg_amount} ಕೆ.ಜಿ"}
 
+# Product family bits for check_compatibility
+_MIX_LIME = 1
+_MIX_DAP = 2
+_MIX_UREA = 4
+_MIX_ZINC = 8
+
+# (required bits, warning) in output order; warnings are shared, do not mutate
+_MIX_CONFLICTS = (
+    (_MIX_LIME | _MIX_DAP, {
+        "en": "⚠️ DO NOT MIX Lime and DAP. Apply Lime 2 weeks before.",
+        "kn": "⚠️ ಸುಣ್ಣ ಮತ್ತು ಡಿ.ಎ.ಪಿ ಮಿಶ್ರಣ ಮಾಡಬೇಡಿ. ಸುಣ್ಣವನ್ನು 2 ವಾರಗಳ ಮೊದಲು ಹಾಕಿ."
+    }),
+    (_MIX_LIME | _MIX_UREA, {
+        "en": "⚠️ DO NOT MIX Lime and Urea. Nitrogen loss occurs.",
+        "kn": "⚠️ ಸುಣ್ಣ ಮತ್ತು ಯೂರಿಯಾ ಮಿಶ್ರಣ ಮಾಡಬೇಡಿ. ಸಾರಜನಕ ನಷ್ಟವಾಗುತ್ತದೆ."
+    }),
+    (_MIX_ZINC | _MIX_DAP, {
+        "en": "⚠️ DO NOT MIX Zinc and DAP. Apply Zinc separately.",
+        "kn": "⚠️ ಜಿಂಕ್ ಮತ್ತು ಡಿ.ಎ.ಪಿ ಮಿಶ್ರಣ ಮಾಡಬೇಡಿ. ಜಿಂಕ್ ಅನ್ನು ಪ್ರತ್ಯೇಕವಾಗಿ ಹಾಕಿ."
+    }),
+)
+
 def check_compatibility(shopping_list: List[ShoppingItem]) -> List[Dict[str, str]]:
     """Check mixing rules."""
-    warnings = []
-    products = [item.product_name.lower() for item in shopping_list if item.total_kg > 0]
-    
-    has_lime = any("lime" in p or "dolomite" in p for p in products)
-    has_dap = any("dap" in p or "phosphate" in p for p in products)
-    has_urea = any("urea" in p or "ammonium" in p for p in products)
-    has_zinc = any("zinc" in p for p in products)
+    mask = 0
+    for item in shopping_list:
+        if not item.total_kg > 0:
+            continue
+        p = item.product_name.lower()
+        if "lime" in p or "dolomite" in p: mask |= _MIX_LIME
+        if "dap" in p or "phosphate" in p: mask |= _MIX_DAP
+        if "urea" in p or "ammonium" in p: mask |= _MIX_UREA
+        if "zinc" in p: mask |= _MIX_ZINC
     
-    if has_lime and has_dap:
-        warnings.append({
-            "en": "⚠️ DO NOT MIX Lime and DAP. Apply Lime 2 weeks before.",
-            "kn": "⚠️ ಸುಣ್ಣ ಮತ್ತು ಡಿ.ಎ.ಪಿ ಮಿಶ್ರಣ ಮಾಡಬೇಡಿ. ಸುಣ್ಣವನ್ನು 2 ವಾರಗಳ ಮೊದಲು ಹಾಕಿ."
-        })
-    if has_lime and has_urea:
-        warnings.append({
-            "en": "⚠️ DO NOT MIX Lime and Urea. Nitrogen loss occurs.",
-            "kn": "⚠️ ಸುಣ್ಣ ಮತ್ತು ಯೂರಿಯಾ ಮಿಶ್ರಣ ಮಾಡಬೇಡಿ. ಸಾರಜನಕ ನಷ್ಟವಾಗುತ್ತದೆ."
-        })
-    if has_zinc and has_dap:
-        warnings.append({
-            "en": "⚠️ DO NOT MIX Zinc and DAP. Apply Zinc separately.",
-            "kn": "⚠️ ಜಿಂಕ್ ಮತ್ತು ಡಿ.ಎ.ಪಿ ಮಿಶ್ರಣ ಮಾಡಬೇಡಿ. ಜಿಂಕ್ ಅನ್ನು ಪ್ರತ್ಯೇಕವಾಗಿ ಹಾಕಿ."
-        })
-        
-    return warnings
+    return [warning for pair, warning in _MIX_CONFLICTS if mask & pair == pair]
+
+# Indexed by weather bucket: 0 = suitable, 1 = moderate rain, 2 = heavy rain
+WEATHER_MESSAGES = (
+    {
+        "en": "✅ Weather suitable for application.",
+        "kn": "✅ ಗೊಬ್ಬರ ಹಾಕಲು ಹವಾಮಾನ ಸೂಕ್ತವಾಗಿದೆ."
+    },
+    {
+        "en": "⚠️ Rain expected: Avoid Urea/Nitrogen application today.",
+        "kn": "⚠️ ಮಳೆ ನಿರೀಕ್ಷೆ: ಇಂದು ಯೂರಿಯಾ ಹಾಕುವುದನ್ನು ತಡೆಯಿರಿ."
+    },
+    {
+        "en": "🔴 HEAVY RAIN FORECAST: STOP! Do not apply fertilizer today.",
+        "kn": "🔴 ಭಾರೀ ಮಳೆ ಮುನ್ಸೂಚನೆ: ನಿಲ್ಲಿಸಿ! ಇಂದು ಗೊಬ್ಬರ ಹಾಕಬೇಡಿ."
+    },
+)
+
+_WEATHER_THRESHOLDS = (RAIN_THRESHOLDS["moderate"], RAIN_THRESHOLDS["heavy"])
+
+def weather_bucket(forecast_mm: float) -> int:
+    # bisect_left counts thresholds strictly below the forecast, i.e. "> threshold"
+    return bisect_left(_WEATHER_THRESHOLDS, forecast_mm)
 
 def check_weather_rule(forecast_mm: float) -> Dict[str, str]:
-    if forecast_mm > RAIN_THRESHOLDS["heavy"]:
-        return {
-            "en": "🔴 HEAVY RAIN FORECAST: STOP! Do not apply fertilizer today.",
-            "kn": "🔴 ಭಾರೀ ಮಳೆ ಮುನ್ಸೂಚನೆ: ನಿಲ್ಲಿಸಿ! ಇಂದು ಗೊಬ್ಬರ ಹಾಕಬೇಡಿ."
-        }
-    elif forecast_mm > RAIN_THRESHOLDS["moderate"]:
-        return {
-            "en": "⚠️ Rain expected: Avoid Urea/Nitrogen application today.",
-            "kn": "⚠️ ಮಳೆ ನಿರೀಕ್ಷೆ: ಇಂದು ಯೂರಿಯಾ ಹಾಕುವುದನ್ನು ತಡೆಯಿರಿ."
-        }
-    else:
-        return {
-            "en": "✅ Weather suitable for application.",
-            "kn": "✅ ಗೊಬ್ಬರ ಹಾಕಲು ಹವಾಮಾನ ಸೂಕ್ತವಾಗಿದೆ."
-        }
+    """Return the shared (read-only) weather message for the forecast."""
+    return WEATHER_MESSAGES[weather_bucket(forecast_mm)]
 
 # =============================================================================
 # MANURE CREDITS & SUBSTITUTES (v5.2)
@@ -166,6 +197,12 @@ MANURE_NUTRIENTS = {
     "poultry": {"n_pct": 3.0, "p_pct": 2.5, "k_pct": 1.5, "availability": 0.5},
 }
 
+# manure -> (n, p, k as fractions, availability), percentages divided once at import
+_MANURE_FACTORS = {
+    name: (data["n_pct"] / 100, data["p_pct"] / 100, data["k_pct"] / 100, data["availability"])
+    for name, data in MANURE_NUTRIENTS.items()
+}
+
 SUBSTITUTES = {
     # If Primary is missing -> Use Alternatives
     "dap": [
@@ -182,22 +219,46 @@ def calculate_manure_credit(manure_type: str, quantity_tons: float) -> Dict[str,
     Calculate nutrient credit from organic manure.
     Returns kg/ha of effective N, P, K.
     """
-    if manure_type not in MANURE_NUTRIENTS:
+    factors = _MANURE_FACTORS.get(manure_type)
+    if factors is None:
         return {"n": 0, "p": 0, "k": 0}
         
-    data = MANURE_NUTRIENTS[manure_type]
-    eff = data["availability"]
+    n_frac, p_frac, k_frac, eff = factors
     
     # Tons to Kg
     kg_total = quantity_tons * 1000
     
-    n_credit = kg_total * (data["n_pct"] / 100) * eff
-    p_credit = kg_total * (data["p_pct"] / 100) * eff
-    k_credit = kg_total * (data["k_pct"] / 100) * eff
+    n_credit = kg_total * n_frac * eff
+    p_credit = kg_total * p_frac * eff
+    k_credit = kg_total * k_frac * eff
     
     return {"n": n_credit, "p": p_credit, "k": k_credit}
 
 
+def apply_manure_credit(
+    products_kg: Tuple[float, float, float],
+    credits: Dict[str, float]
+) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+    """
+    Offset (urea, dap, mop) kg by the manure N/P/K credit.
+    Returns (net product kg clamped at 0, product kg saved).
+    """
+    urea_kg, dap_kg, mop_kg = products_kg
+    
+    urea_reduction = credits['n'] / UREA_N_FRACTION
+    dap_reduction = credits['p'] / DAP_P_FRACTION
+    mop_reduction = credits['k'] / MOP_K_FRACTION
+    
+    return (
+        (
+            max(0, urea_kg - urea_reduction),
+            max(0, dap_kg - dap_reduction),
+            max(0, mop_kg - mop_reduction),
+        ),
+        (urea_reduction, dap_reduction, mop_reduction),
+    )
+
+
 def get_substitute_advice(product: str, bag_count: int) -> Dict[str, str]:
     """Get Plan B if product is unavailable."""
     if bag_count == 0:
@@ -216,46 +277,108 @@ def get_substitute_advice(product: str, bag_count: int) -> Dict[str, str]:
 def generate_voice_script(advisory: FarmerAdvisory) -> str:
     """Generate phonetic Kannada script."""
     # Logic uses Kannada fields
-    script = f"Namaskara. Nimma {advisory.crop_name} belege..."
-    script += f" Bithane dina: {advisory.sowing_date}..."
-    
-    script += " Neevu khareedi madbekada gobbara: "
+    parts = [
+        f"Namaskara. Nimma {advisory.crop_name} belege...",
+        f" Bithane dina: {advisory.sowing_date}...",
+        " Neevu khareedi madbekada gobbara: ",
+    ]
     for item in advisory.shopping_list:
         if item.bags > 0:
-            script += f"{item.bags} bag {item.product_kn}, "
+            parts.append(f"{item.bags} bag {item.product_kn}, ")
             
-    if any("Lime" in w.get('en', '') for w in advisory.simple_warnings):
-        script += " Manninalli amla amsha hecchige ide, sunna haakodu kaddaya."
+    if "lime" in advisory.flags:
+        parts.append(" Manninalli amla amsha hecchige ide, sunna haakodu kaddaya.")
         
-    script += " Dhanyavadagalu."
-    return script
+    parts.append(" Dhanyavadagalu.")
+    return "".join(parts)
+
+# product -> (bag_size, near-full threshold, name_en, name_kn); names are None
+# when the product has no local name and its title-cased key is used instead.
+_BAG_SPECS: Dict[str, Tuple[int, float, Optional[str], Optional[str]]] = {
+    key: (
+        BAG_SIZES.get(key, 50),
+        BAG_SIZES.get(key, 50) * 0.95,
+        LOCAL_NAMES[key]["en"] if key in LOCAL_NAMES else None,
+        LOCAL_NAMES[key]["kn"] if key in LOCAL_NAMES else None,
+    )
+    for key in {**BAG_SIZES, **LOCAL_NAMES}
+}
+_DEFAULT_BAG_SPEC = (50, 50 * 0.95, None, None)
 
 def convert_to_bags(product: str, kg_amount: float) -> ShoppingItem:
     """
     Convert raw kg to bags + loose kg.
+    Items are cached per (product, kg rounded to 0.1) and shared; they are frozen.
     """
-    bag_size = BAG_SIZES.get(product.lower(), 50)
+    return _convert_to_bags_cached(product, round(kg_amount, 1))
+
+def _bag_split(product: str, kg_amount: float) -> Tuple[int, float]:
+    """Split kg (rounded to 0.1) into (bags, loose kg) without building a ShoppingItem."""
+    bag_size, full_threshold, _, _ = _BAG_SPECS.get(product.lower(), _DEFAULT_BAG_SPEC)
     kg_amount = round(kg_amount, 1)
     
     bags = int(kg_amount // bag_size)
     loose = round(kg_amount % bag_size, 1)
     
-    if loose > (bag_size * 0.95):
+    if loose > full_threshold:
         bags += 1
         loose = 0
+    return bags, loose
+
+@functools.lru_cache(maxsize=512, typed=True)
+def _convert_to_bags_cached(product: str, kg_amount: float) -> ShoppingItem:
+    bag_size, _, name_en, name_kn = _BAG_SPECS.get(product.lower(), _DEFAULT_BAG_SPEC)
+    bags, loose = _bag_split(product, kg_amount)
     
-    names = LOCAL_NAMES.get(product.lower(), {"en": product.title(), "kn": product.title()})
+    if name_en is None:
+        name_en = name_kn = product.title()
     
     return ShoppingItem(
         product_name=product,
-        product_en=names["en"],
-        product_kn=names["kn"],
+        product_en=name_en,
+        product_kn=name_kn,
         total_kg=kg_amount,
         bags=bags,
         loose_kg=loose,
         bag_size=bag_size
     )
 
+# Product prefixes for schedule lines, e.g. "ಯೂರಿಯಾ: 1 ಬ್ಯಾಗ್"
+SCHEDULE_LABELS = {
+    "urea": ("Urea: ", sys.intern("ಯೂರಿಯಾ: ")),
+    "dap": ("DAP: ", sys.intern("ಡಿ.ಎ.ಪಿ: ")),
+    "mop": ("MOP: ", sys.intern("ಪೊಟ್ಯಾಷ್: ")),
+}
+
+def format_bag_quantity(bags: int, loose_kg: float) -> Tuple[str, str]:
+    """Format bags + loose kg as (en, kn) strings, e.g. "2 Bags + 5 kg"."""
+    loose = f" + {loose_kg:.0f} kg" if loose_kg > 0 else ""
+    if bags > 0:
+        return f"{bags} Bags{loose}", f"{bags} ಬ್ಯಾಗ್{loose}"
+    return loose[3:], loose[3:]
+
+# Stage keyword -> (days after sowing, Kannada timing); first match wins
+STAGE_TIMINGS = (
+    ("basal", (0, "ಬಿತ್ತನೆ/ನಾಟಿ ಸಮಯದಲ್ಲಿ")),
+    ("tillering", (25, "ನಾಟಿಯಾದ 20-25 ದಿನಗಳಿಗೆ")),
+    ("vegetative", (25, "ನಾಟಿಯಾದ 20-25 ದಿನಗಳಿಗೆ")),
+    ("panicle", (55, "ನಾಟಿಯಾದ 50-60 ದಿನಗಳಿಗೆ")),
+    ("flowering", (55, "ನಾಟಿಯಾದ 50-60 ದಿನಗಳಿಗೆ")),
+)
+DEFAULT_STAGE_TIMING = (45, "ಮುಂದಿನ ಹಂತ")
+
+@functools.lru_cache(maxsize=64)
+def _stage_timing(stage: str) -> Tuple[int, str]:
+    # Stage names come from a small fixed set in the crop splits, so cache by exact name
+    return next(
+        (timing for keyword, timing in STAGE_TIMINGS if keyword in stage),
+        DEFAULT_STAGE_TIMING
+    )
+
+@functools.lru_cache(maxsize=256)
+def _stage_date_str(sowing_ordinal: int, days_offset: int) -> str:
+    return date.fromordinal(sowing_ordinal + days_offset).strftime("%d-%b-%Y")
+
 def generate_schedule(
     sowing_date: datetime,
     splits: Dict,
@@ -270,25 +393,12 @@ def generate_schedule(
     Generate a calendar-based schedule from splits.
     """
     schedule_items = []
+    sowing_ordinal = sowing_date.toordinal()
     
     for stage, details in splits.items():
         # Timing logic
-        days_offset = 0
-        if "basal" in stage:
-            days_offset = 0
-            timing_str = "ಬಿತ್ತನೆ/ನಾಟಿ ಸಮಯದಲ್ಲಿ"
-        elif "tillering" in stage or "vegetative" in stage:
-            days_offset = 25
-            timing_str = "ನಾಟಿಯಾದ 20-25 ದಿನಗಳಿಗೆ"
-        elif "panicle" in stage or "flowering" in stage:
-            days_offset = 55
-            timing_str = "ನಾಟಿಯಾದ 50-60 ದಿನಗಳಿಗೆ"
-        else:
-            days_offset = 45 # Default
-            timing_str = "ಮುಂದಿನ ಹಂತ"
-            
-        target_date = sowing_date + timedelta(days=days_offset)
-        date_str = target_date.strftime("%d-%b-%Y")
+        days_offset, timing_str = _stage_timing(stage)
+        date_str = _stage_date_str(sowing_ordinal, days_offset)
         
         p_pct = details.get("p_pct", 0)
         n_pct = details.get("n_pct", 0)
@@ -301,35 +411,12 @@ def generate_schedule(
         products_en = []
         products_kn = []
         
-        if split_urea > 1:
-            bags = convert_to_bags("urea", split_urea)
-            qty_en = f"{bags.bags} Bags" if bags.bags > 0 else ""
-            qty_kn = f"{bags.bags} ಬ್ಯಾಗ್" if bags.bags > 0 else ""
-            if bags.loose_kg > 0:
-                qty_en += f" + {bags.loose_kg:.0f} kg"
-                qty_kn += f" + {bags.loose_kg:.0f} kg"
-            products_en.append(f"Urea: {qty_en.strip(' + ')}")
-            products_kn.append(f"ಯೂರಿಯಾ: {qty_kn.strip(' + ')}")
-            
-        if split_dap > 1:
-            bags = convert_to_bags("dap", split_dap)
-            qty_en = f"{bags.bags} Bags" if bags.bags > 0 else ""
-            qty_kn = f"{bags.bags} ಬ್ಯಾಗ್" if bags.bags > 0 else ""
-            if bags.loose_kg > 0:
-                qty_en += f" + {bags.loose_kg:.0f} kg"
-                qty_kn += f" + {bags.loose_kg:.0f} kg"
-            products_en.append(f"DAP: {qty_en.strip(' + ')}")
-            products_kn.append(f"ಡಿ.ಎ.ಪಿ: {qty_kn.strip(' + ')}")
-
-        if split_mop > 1:
-            bags = convert_to_bags("mop", split_mop)
-            qty_en = f"{bags.bags} Bags" if bags.bags > 0 else ""
-            qty_kn = f"{bags.bags} ಬ್ಯಾಗ್" if bags.bags > 0 else ""
-            if bags.loose_kg > 0:
-                qty_en += f" + {bags.loose_kg:.0f} kg"
-                qty_kn += f" + {bags.loose_kg:.0f} kg"
-            products_en.append(f"MOP: {qty_en.strip(' + ')}")
-            products_kn.append(f"ಪೊಟ್ಯಾಷ್: {qty_kn.strip(' + ')}")
+        for product, split_kg in (("urea", split_urea), ("dap", split_dap), ("mop", split_mop)):
+            if split_kg > 1:
+                qty_en, qty_kn = format_bag_quantity(*_bag_split(product, split_kg))
+                label_en, label_kn = SCHEDULE_LABELS[product]
+                products_en.append(label_en + qty_en)
+                products_kn.append(label_kn + qty_kn)
             
         if not products_en:
             continue
@@ -349,6 +436,58 @@ def generate_schedule(
         
     return schedule_items
 
+# Known soil warnings (EN or KN wording), matched in one scan per warning.
+# When several match, the earlier entry in _WARNING_PRIORITY wins.
+_WARNING_RE = re.compile(
+    r"(?P<acidity>Al toxicity|Al ವಿಷತ್ವ)"
+    r"|(?P<drainage>Drainage|ನೀರು ಬಸಿಯುವಿಕೆ)"
+    r"|(?P<gps>GPS Mode)"
+)
+_WARNING_PRIORITY = ("acidity", "drainage", "gps")
+
+_WARNING_TRANSLATIONS = {
+    "acidity": {
+        "en": "⚠️ High Acidity - Lime application mandatory.",
+        "kn": "⚠️ ಮಣ್ಣಿನಲ್ಲಿ ಆಮ್ಲತೆ ಹೆಚ್ಚಾಗಿದೆ - ಸುಣ್ಣ ಹಾಕುವುದು ಕಡ್ಡಾಯ."
+    },
+    "drainage": {
+        "en": "⚠️ Improve drainage to avoid waterlogging.",
+        "kn": "⚠️ ಹೊಲದಲ್ಲಿ ನೀರು ನಿಲ್ಲದಂತೆ ನೋಡಿಕೊಳ್ಳಿ."
+    },
+}
+
+# Health card headline, shared (read-only) like WEATHER_MESSAGES
+HEALTH_GOOD = {
+    "en": "✅ Soil Health: Good",
+    "kn": "✅ ಮಣ್ಣಿನ ಆರೋಗ್ಯ: ಉತ್ತಮವಾಗಿದೆ"
+}
+HEALTH_NEEDS_IMPROVEMENT = {
+    "en": "⚠️ Soil Health: Needs Improvement",
+    "kn": "⚠️ ಮಣ್ಣಿನ ಆರೋಗ್ಯ: ಸುಧಾರಣೆ ಅಗತ್ಯ"
+}
+
+def _classify_warning(warning: str) -> Optional[str]:
+    found = {m.lastgroup for m in _WARNING_RE.finditer(warning)}
+    for kind in _WARNING_PRIORITY:
+        if kind in found:
+            return kind
+    return None
+
+def parse_sowing_date(value: Any) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD sowing date; None if missing or malformed."""
+    # C-accelerated ISO parser only for strict YYYY-MM-DD; it also accepts
+    # forms strptime rejects (20240410, 2024-W15-3, times), so those and
+    # loose forms like 2024-6-5 go through strptime
+    if type(value) is str and len(value) == 10 and value[4] == value[7] == "-":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except (ValueError, TypeError):
+        return None
+
 def simplify_advisory(
     crop: str,
     sowing_date_str: str,
@@ -367,18 +506,14 @@ def simplify_advisory(
     """
     Create the full farmer advisory structure.
     """
-    try:
-        sowing_date = datetime.strptime(sowing_date_str, "%Y-%m-%d")
-    except:
-        sowing_date = datetime.now()
+    sowing_date = parse_sowing_date(sowing_date_str) or datetime.now()
+    sowing_str = sowing_date.strftime("%d-%m-%Y")
         
-    acre_factor = 2.5 
-    
-    urea_acre = urea_kg / acre_factor
-    dap_acre = dap_kg / acre_factor
-    mop_acre = mop_kg / acre_factor
-    zinc_acre = zinc_kg / acre_factor
-    lime_tons_acre = lime_t_ha / acre_factor
+    urea_acre = urea_kg / ACRE_FACTOR
+    dap_acre = dap_kg / ACRE_FACTOR
+    mop_acre = mop_kg / ACRE_FACTOR
+    zinc_acre = zinc_kg / ACRE_FACTOR
+    lime_tons_acre = lime_t_ha / ACRE_FACTOR
     
     manure_msg = {}
     net_urea_acre = urea_acre
@@ -389,13 +524,9 @@ def simplify_advisory(
         manure_tons_acre = manure_tons 
         credits = calculate_manure_credit(manure_type, manure_tons_acre) 
         
-        urea_reduction = credits['n'] / 0.46
-        dap_reduction = credits['p'] / 0.46 
-        mop_reduction = credits['k'] / 0.60
-        
-        net_urea_acre = max(0, urea_acre - urea_reduction)
-        net_dap_acre = max(0, dap_acre - dap_reduction)
-        net_mop_acre = max(0, mop_acre - mop_reduction)
+        (net_urea_acre, net_dap_acre, net_mop_acre), (urea_reduction, dap_reduction, _) = apply_manure_credit(
+            (urea_acre, dap_acre, mop_acre), credits
+        )
         
         manure_msg = {
             "en": f"✅ Manure Credit: Reduced Urea by {round(urea_reduction,1)}kg & DAP by {round(dap_reduction,1)}kg",
@@ -423,71 +554,73 @@ def simplify_advisory(
         net_urea_acre, net_dap_acre, net_mop_acre
     )
     
-    # 3. Simple Soil Health Card
-    health_card_status = {
-        "en": "✅ Soil Health: Good" if not any("Critical" in w for w in raw_warnings) else "⚠️ Soil Health: Needs Improvement",
-        "kn": "✅ ಮಣ್ಣಿನ ಆರೋಗ್ಯ: ಉತ್ತಮವಾಗಿದೆ" if not any("Critical" in w for w in raw_warnings) else "⚠️ ಮಣ್ಣಿನ ಆರೋಗ್ಯ: ಸುಧಾರಣೆ ಅಗತ್ಯ"
-    }
-    
-    health_card = [
-        health_card_status,
-        {
-            "en": f"📅 Sowing Date: {sowing_date.strftime('%d-%m-%Y')}",
-            "kn": f"📅 ಬಿತ್ತನೆ ದಿನಾಂಕ: {sowing_date.strftime('%d-%m-%Y')}"
-        }
-    ]
-    
     # 4. Warnings
     simple_warnings = []
+    flags = set()  # "lime" / "critical", recorded as warnings are added
     
-    # A. Weather Rule
+    # A. Weather Rule (no weather message mentions lime)
     weather_msg = check_weather_rule(weather_forecast_mm)
     simple_warnings.append(weather_msg)
     
     # B. Compatibility Rule
     mix_warnings = check_compatibility(shopping)
     simple_warnings.extend(mix_warnings)
+    if any("Lime" in w["en"] for w in mix_warnings):
+        flags.add("lime")
     
     # C. Existing Soil Warnings
     for w in raw_warnings:
+        if "Critical" in w:
+            flags.add("critical")
         # Translate commonly known warnings
-        if "Al toxicity" in w or "Al ವಿಷತ್ವ" in w:
-            simple_warnings.append({
-                "en": "⚠️ High Acidity - Lime application mandatory.",
-                "kn": "⚠️ ಮಣ್ಣಿನಲ್ಲಿ ಆಮ್ಲತೆ ಹೆಚ್ಚಾಗಿದೆ - ಸುಣ್ಣ ಹಾಕುವುದು ಕಡ್ಡಾಯ."
-            })
-        elif "Drainage" in w or "ನೀರು ಬಸಿಯುವಿಕೆ" in w:
-            simple_warnings.append({
-                "en": "⚠️ Improve drainage to avoid waterlogging.",
-                "kn": "⚠️ ಹೊಲದಲ್ಲಿ ನೀರು ನಿಲ್ಲದಂತೆ ನೋಡಿಕೊಳ್ಳಿ."
-            })
-        elif "GPS Mode" in w:
+        kind = _classify_warning(w)
+        if kind == "acidity" or (kind != "drainage" and "Lime" in w):
+            flags.add("lime")
+        if kind == "gps":
              # Extract Taluk/Region if present
              region = w.split("for")[-1].strip() if "for" in w else ""
              simple_warnings.append({
                 "en": w,
                 "kn": f"⚠️ GPS ವಿಧಾನ ({region} ಭಾಗದ ಸರಾಸರಿ ಮಾಹಿತಿ) ಬಳಸಲಾಗಿದೆ." if region else "⚠️ GPS ವಿಧಾನ ಬಳಸಲಾಗಿದೆ."
              })
+        elif kind:
+            simple_warnings.append(_WARNING_TRANSLATIONS[kind])
         else:
             simple_warnings.append({"en": w, "kn": w}) # Fallback
             
+    # 3. Simple Soil Health Card
+    health_card_status = HEALTH_NEEDS_IMPROVEMENT if "critical" in flags else HEALTH_GOOD
+    
+    health_card = [
+        health_card_status,
+        {
+            "en": f"📅 Sowing Date: {sowing_str}",
+            "kn": f"📅 ಬಿತ್ತನೆ ದಿನಾಂಕ: {sowing_str}"
+        }
+    ]
+    
     # D. Substitutes
+    # Only products listed in SUBSTITUTES can have a Plan B
+    shopping_by_name = {item.product_name.lower(): item for item in shopping}
     substitutes = []
-    for item in shopping:
-        sub = get_substitute_advice(item.product_name, item.bags)
-        if sub:
-            substitutes.append(sub)
+    for product in SUBSTITUTES:
+        item = shopping_by_name.get(product)
+        if item is not None and item.bags > 0:
+            sub = get_substitute_advice(product, item.bags)
+            if sub:
+                substitutes.append(sub)
             
     return FarmerAdvisory(
         crop_name=crop,
-        sowing_date=sowing_date.strftime("%d-%m-%Y"),
+        sowing_date=sowing_str,
         shopping_list=shopping,
         schedule=schedule,
         simple_warnings=simple_warnings,
         soil_health_card=health_card,
         substitutes=substitutes,
         voice_script="",
-        manure_credit_msg=manure_msg
+        manure_credit_msg=manure_msg,
+        flags=frozenset(flags)
     )
     # Generate Script
     partial_advisory.voice_script = generate_voice_script(partial_advisory)
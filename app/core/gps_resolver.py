@@ -1,9 +1,56 @@
 import csv
-import json
 import os
+import sys
 import functools
 from typing import Dict, Optional, Tuple
 
+import orjson
+
+def _intern_values(obj: Dict) -> Dict:
+    return {k: sys.intern(v) if isinstance(v, str) else v for k, v in obj.items()}
+
+# Approximate segments of Swarna, Sita, Udyavara rivers
+# Format: (lat1, lon1, lat2, lon2) - simplified line segments
+RIVERS = (
+    (13.40, 74.70, 13.35, 74.80), # Swarna towards sea
+    (13.45, 74.75, 13.42, 74.70), # Sita river
+    (13.25, 74.75, 13.28, 74.78), # Udyavara river
+    (13.60, 74.65, 13.65, 74.70)  # Varahi/North rivers
+)
+
+# Per segment: (vx, vy, wx - vx, wy - vy, squared length)
+_RIVER_SEGMENTS = tuple(
+    (vx, vy, wx - vx, wy - vy, (vx - wx)**2 + (vy - wy)**2)
+    for vx, vy, wx, wy in RIVERS
+)
+
+_LOWLAND_THRESHOLD_SQ = 0.015**2 # Approx 1.5km
+
+@functools.lru_cache(maxsize=4)
+def _load_profiles(path: str) -> Dict:
+    """Parse a taluk profiles file once per process; resolvers share the read-only result."""
+    with open(path, 'rb') as f:
+        profiles = orjson.loads(f.read())
+    # Intern class labels ("low", "acidic", ...) so they hash/compare
+    # as the same objects as the literals used downstream
+    return {taluk: _intern_values(profile) for taluk, profile in profiles.items()}
+
+_PRE_MONSOON_MONTHS = frozenset((3, 4, 5))
+_SANDY_TEXTURES = frozenset(("sandy", "sandy_loam"))
+
+def _profile_classes(profile: Dict) -> Tuple[str, ...]:
+    """(n, p, k, ph_class, texture, organic_carbon) with defaults for missing fields"""
+    return (
+        profile.get("nitrogen_class", "medium"),
+        profile.get("phosphorus_class", "medium"),
+        profile.get("potassium_class", "medium"),
+        profile.get("ph_class", "acidic"),
+        profile.get("soil_texture_class", "lateritic"),
+        profile.get("organic_carbon_class", "medium"),
+    )
+
+_DEFAULT_CLASSES = _profile_classes({})
+
 class GPSResolver:
     """
     Resolves Taluk/Zone from GPS coordinates and fetches average soil profile.
@@ -20,6 +67,7 @@ class GPSResolver:
         self.profiles_file = os.path.join(profiles_dir, "taluk_profiles.json")
         self.bounds = []
         self.profiles = {}
+        self._classes = {}
         self._load_data()
         
     def _load_data(self):
@@ -28,30 +76,31 @@ class GPSResolver:
             with open(self.bounds_file, 'r') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    self.bounds.append({
-                        "taluk": row["taluk"],
-                        "min_lat": float(row["min_lat"]),
-                        "max_lat": float(row["max_lat"]),
-                        "min_lon": float(row["min_lon"]),
-                        "max_lon": float(row["max_lon"])
-                    })
+                    # (min_lat, max_lat, min_lon, max_lon, taluk) - tuples unpack
+                    # faster than per-field dict lookups in resolve_taluk
+                    self.bounds.append((
+                        float(row["min_lat"]),
+                        float(row["max_lat"]),
+                        float(row["min_lon"]),
+                        float(row["max_lon"]),
+                        sys.intern(row["taluk"])
+                    ))
         except FileNotFoundError:
             print(f"Warning: Bounds file not found at {self.bounds_file}")
 
         # Load Profiles
         try:
-            with open(self.profiles_file, 'r') as f:
-                self.profiles = json.load(f)
+            self.profiles = _load_profiles(self.profiles_file)
         except FileNotFoundError:
             print(f"Warning: Profiles file not found at {self.profiles_file}")
+        self._classes = {taluk: _profile_classes(p) for taluk, p in self.profiles.items()}
 
     @functools.lru_cache(maxsize=1024)
     def resolve_taluk(self, lat: float, lon: float) -> Optional[str]:
         """Find which taluk contains the coordinate."""
-        for b in self.bounds:
-            if (b["min_lat"] <= lat <= b["max_lat"]) and \
-               (b["min_lon"] <= lon <= b["max_lon"]):
-                return b["taluk"]
+        for min_lat, max_lat, min_lon, max_lon, taluk in self.bounds:
+            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
+                return taluk
         return "Udupi" # Default fallback
 
     def get_agro_zone(self, lon: float) -> str:
@@ -72,70 +121,49 @@ class GPSResolver:
         Heuristic: Locations close to major rivers are likely 'Lowland' (Gadde).
         Simple proximity check to known river segments in Udupi.
         """
-        # Approximate segments of Swarna, Sita, Udyavara rivers
-        # Format: (lat1, lon1, lat2, lon2) - simplified line segments
-        RIVERS = [
-            (13.40, 74.70, 13.35, 74.80), # Swarna towards sea
-            (13.45, 74.75, 13.42, 74.70), # Sita river
-            (13.25, 74.75, 13.28, 74.78), # Udyavara river
-            (13.60, 74.65, 13.65, 74.70)  # Varahi/North rivers
-        ]
-        
-    
-        threshold = 0.015 # Approx 1.5km
-        
-        def dist_sq(x1, y1, x2, y2):
-            return (x1-x2)**2 + (y1-y2)**2
-
-        for r in RIVERS:
-            # Segment V(r0,r1) to W(r2,r3)
-            # Point P(lat, lon)
-            vx, vy = r[0], r[1]
-            wx, wy = r[2], r[3]
-            
-            l2 = dist_sq(vx, vy, wx, wy)
-            if l2 == 0: 
-                d2 = dist_sq(lat, lon, vx, vy)
+        for vx, vy, dx, dy, l2 in _RIVER_SEGMENTS:
+            # Segment V(vx,vy) to W(vx+dx, vy+dy), point P(lat, lon)
+            if l2 == 0:
+                px, py = vx, vy
             else:
-                t = ((lat - vx) * (wx - vx) + (lon - vy) * (wy - vy)) / l2
+                t = ((lat - vx) * dx + (lon - vy) * dy) / l2
                 t = max(0, min(1, t))
+                px = vx + t * dx
+                py = vy + t * dy
                 
-                proj_x = vx + t * (wx - vx)
-                proj_y = vy + t * (wy - vy)
-                
-                d2 = dist_sq(lat, lon, proj_x, proj_y)
-                
-            if d2 < (threshold**2):
+            if (lat - px)**2 + (lon - py)**2 < _LOWLAND_THRESHOLD_SQ:
                 return True
             
         return False
 
     def get_profile(self, lat: float, lon: float, land_type_override: Optional[str] = None, month: int = 6) -> Dict:
         """Get refined soil profile for location, considering seasonality."""
+        lowland_override = (land_type_override.lower() == "lowland") if land_type_override else None
+        # Copy so callers can't mutate the cached entry
+        return dict(self._build_profile(lat, lon, lowland_override, month))
+
+    @functools.lru_cache(maxsize=4096)
+    def _build_profile(self, lat: float, lon: float, lowland_override: Optional[bool], month: int) -> Dict:
         taluk = self.resolve_taluk(lat, lon)
         if not taluk:
             taluk = "Udupi"
             
         # 1. Base Profile from Taluk Average
-        base_profile = self.profiles.get(taluk, self.profiles.get("Udupi", {}))
+        n, p, k, ph_class, texture, organic_carbon = self._classes.get(
+            taluk, self._classes.get("Udupi", _DEFAULT_CLASSES)
+        )
         
         # 2. Refine based on Agro-Climatic Zone
         zone = self.get_agro_zone(lon)
         
         # 3. Refine based on Topography (Auto-detected or User Input)
-        if land_type_override:
-            is_lowland = (land_type_override.lower() == "lowland")
+        if lowland_override is not None:
+            is_lowland = lowland_override
         else:
             is_lowland = self.is_lowland(lat, lon)
             
         topo_type = "Lowland" if is_lowland else "Upland"
         
-        # Default values from Taluk
-        n = base_profile.get("nitrogen_class", "medium")
-        p = base_profile.get("phosphorus_class", "medium")
-        k = base_profile.get("potassium_class", "medium")
-        ph_class = base_profile.get("ph_class", "acidic")
-        texture = base_profile.get("soil_texture_class", "lateritic")
         salinity = "Normal"
         
         # 4. Apply Heuristics (The "Expert" Layer)
@@ -149,7 +177,7 @@ class GPSResolver:
             ph_class = "neutral"
             
             # SEASONAL SALINITY LOGIC (Pre-Monsoon: March, April, May)
-            if month in [3, 4, 5]:
+            if month in _PRE_MONSOON_MONTHS:
                 salinity = "High"
                 ph_class = "alkaline" # Salt water intrusion raises pH
             
@@ -160,7 +188,7 @@ class GPSResolver:
             
         elif zone == "midland":
             # Midlands are typically lateritic, not sandy
-            if texture in ["sandy", "sandy_loam"]:
+            if texture in _SANDY_TEXTURES:
                 texture = "lateritic"
             ph_class = "acidic"
             
@@ -180,7 +208,7 @@ class GPSResolver:
             "k": k,
             "ph_class": ph_class,
             "texture": texture,
-            "organic_carbon": base_profile.get("organic_carbon_class", "medium"),
+            "organic_carbon": organic_carbon,
             "salinity": salinity
         }
 
@@ -9,6 +9,7 @@ Based on:
 - KVK Brahmavar recommendations for Udupi lateritic soils
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
 from enum import Enum
@@ -26,6 +27,10 @@ class LimeProduct(Enum):
     SHELL_LIME = ("shell_lime", "ಚಿಪ್ಪಿ ಸುಣ್ಣ", 85)  # Ground shells
     SLAG = ("slag", "ಸ್ಲ್ಯಾಗ್", 80)  # Steel slag
 
+# Product name -> (name, kannada, neutralizing value)
+PRODUCT_BY_NAME = {product.value[0]: product.value for product in LimeProduct}
+DEFAULT_PRODUCT = LimeProduct.DOLOMITE.value
+
 
 # SMP Buffer pH to Lime Requirement Table (t/ha CaCO3 equivalent)
 # Target pH 6.5 for 15 cm depth, medium texture soil
@@ -48,6 +53,19 @@ SMP_LIME_TABLE = {
     (4.0, 4.2): 7.5,
 }
 
+# Same table sorted by lower edge for binary search: ranges are [low, high)
+_SMP_ROWS = sorted(SMP_LIME_TABLE.items())
+_SMP_LOWS = tuple(low for (low, _), _ in _SMP_ROWS)
+_SMP_HIGHS = tuple(high for (_, high), _ in _SMP_ROWS)
+_SMP_LIME = tuple(amount for _, amount in _SMP_ROWS)
+
+def lookup_smp_lime(buffer_ph: float) -> float:
+    """SMP lime requirement (t/ha) for a buffer pH, or 0 if outside the table"""
+    idx = bisect_right(_SMP_LOWS, buffer_ph) - 1
+    if idx >= 0 and buffer_ph < _SMP_HIGHS[idx]:
+        return _SMP_LIME[idx]
+    return 0
+
 # Texture adjustment factors (relative to medium texture)
 TEXTURE_FACTORS = {
     "sandy": 0.6,       # Less buffering, needs less lime
@@ -72,12 +90,22 @@ TARGET_PH = {
     "acid_saline": 6.0,  # Special case
 }
 
+# Static Kannada messages used in results
+MSG_NO_LIME_PH_OK = "ಸುಣ್ಣ ಅಗತ್ಯವಿಲ್ಲ - pH ಸಾಕಷ್ಟು ಇದೆ"
+MSG_PH_OK_NO_LIME = "✅ ಮಣ್ಣಿನ pH ಸೂಕ್ತವಾಗಿದೆ, ಸುಣ್ಣ ಅಗತ್ಯವಿಲ್ಲ"
+MSG_NO_LIME = "ಸುಣ್ಣ ಅಗತ್ಯವಿಲ್ಲ"
+MSG_PH_OK = "✅ ಮಣ್ಣಿನ pH ಸೂಕ್ತವಾಗಿದೆ"
+MSG_APPLICATION_TIMING = "⏰ ಮಳೆಗಾಲಕ್ಕೆ ಮುಂಚೆ ಹಾಕಿ, 15 ಸೆಂ.ಮೀ ಆಳಕ್ಕೆ ಮಿಶ್ರ ಮಾಡಿ"
+WARN_VERY_ACIDIC = "⚠️ ಅತಿ ಆಮ್ಲೀಯ ಮಣ್ಣು - ಎರಡು ಬಾರಿ ಸುಣ್ಣ ಹಾಕಬೇಕು"
+WARN_SPLIT_HIGH_LIME = "⚠️ 2 ಟನ್/ಹೆ ಮೊದಲು, ಉಳಿದದ್ದು 6 ತಿಂಗಳ ನಂತರ"
+WARN_TEST_BUFFER_PH = "⚠️ ನಿಖರವಾದ ಲೆಕ್ಕಕ್ಕೆ ಬಫರ್ pH ಪರೀಕ್ಷೆ ಮಾಡಿ"
+
 
 # =============================================================================
 # LIME CALCULATOR CLASS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LimeResult:
     """Result of lime requirement calculation"""
     needs_lime: bool
@@ -130,10 +158,7 @@ class LimeCalculator:
     
     def _get_product(self, name: str) -> Tuple[str, str, int]:
         """Get lime product by name"""
-        for product in LimeProduct:
-            if product.value[0] == name:
-                return product.value
-        return LimeProduct.DOLOMITE.value  # Default
+        return PRODUCT_BY_NAME.get(name, DEFAULT_PRODUCT)
     
     def calculate_buffer_ph_method(self) -> LimeResult:
         """
@@ -141,37 +166,37 @@ class LimeCalculator:
         Requires laboratory buffer pH measurement.
         """
         warnings = []
+        product_type, product_kannada, neutralizing_value = self.product
+        soil_ph = self.soil_ph
+        target_ph = self.target_ph
         
         # Check if lime is needed
-        if self.soil_ph >= self.target_ph:
+        if soil_ph >= target_ph:
             return LimeResult(
                 needs_lime=False,
                 lime_required_t_ha=0,
                 product_amount_t_ha=0,
-                product_type=self.product[0],
-                product_kannada=self.product[1],
+                product_type=product_type,
+                product_kannada=product_kannada,
                 bags_per_acre=0,
-                target_ph=self.target_ph,
-                current_ph=self.soil_ph,
+                target_ph=target_ph,
+                current_ph=soil_ph,
                 method_used="buffer_ph",
                 confidence="high",
-                warnings=["ಸುಣ್ಣ ಅಗತ್ಯವಿಲ್ಲ - pH ಸಾಕಷ್ಟು ಇದೆ"],
-                kannada_summary=["✅ ಮಣ್ಣಿನ pH ಸೂಕ್ತವಾಗಿದೆ, ಸುಣ್ಣ ಅಗತ್ಯವಿಲ್ಲ"]
+                warnings=[MSG_NO_LIME_PH_OK],
+                kannada_summary=[MSG_PH_OK_NO_LIME]
             )
         
         if self.buffer_ph is None:
             raise ValueError("Buffer pH required for this method. Use calculate_empirical_method() instead.")
         
         # Look up lime requirement from SMP table
-        base_lime = 0
-        for (low, high), amount in SMP_LIME_TABLE.items():
-            if low <= self.buffer_ph < high:
-                base_lime = amount
-                break
+        buffer_ph = self.buffer_ph
+        base_lime = lookup_smp_lime(buffer_ph)
         
-        if base_lime == 0 and self.buffer_ph < 4.0:
+        if base_lime == 0 and buffer_ph < 4.0:
             base_lime = 8.0  # Maximum for very low buffer pH
-            warnings.append("⚠️ ಅತಿ ಆಮ್ಲೀಯ ಮಣ್ಣು - ಎರಡು ಬಾರಿ ಸುಣ್ಣ ಹಾಕಬೇಕು")
+            warnings.append(WARN_VERY_ACIDIC)
         
         # Apply adjustments
         texture_adj = TEXTURE_FACTORS.get(self.soil_texture, 1.0)
@@ -181,32 +206,32 @@ class LimeCalculator:
         lime_caco3 = base_lime * texture_adj * depth_adj
         
         # Adjust for product neutralizing value
-        product_lime = lime_caco3 * (100 / self.product[2])
+        product_lime = lime_caco3 * (100 / neutralizing_value)
         
         # Convert to bags per acre (1 acre = 0.4 ha, 50 kg bags)
         bags_per_acre = int((product_lime * 0.4 * 1000) / 50)
         
         # Generate Kannada summary
         kannada_summary = [
-            f"📊 ಪ್ರಸ್ತುತ pH: {self.soil_ph}, ಗುರಿ pH: {self.target_ph}",
-            f"🧪 ಬಫರ್ pH: {self.buffer_ph}",
-            f"💊 {self.product[1]}: {product_lime:.1f} ಟನ್/ಹೆ (ಸುಮಾರು {bags_per_acre} ಚೀಲ/ಎಕರೆ)",
-            "⏰ ಮಳೆಗಾಲಕ್ಕೆ ಮುಂಚೆ ಹಾಕಿ, 15 ಸೆಂ.ಮೀ ಆಳಕ್ಕೆ ಮಿಶ್ರ ಮಾಡಿ"
+            f"📊 ಪ್ರಸ್ತುತ pH: {soil_ph}, ಗುರಿ pH: {target_ph}",
+            f"🧪 ಬಫರ್ pH: {buffer_ph}",
+            f"💊 {product_kannada}: {product_lime:.1f} ಟನ್/ಹೆ (ಸುಮಾರು {bags_per_acre} ಚೀಲ/ಎಕರೆ)",
+            MSG_APPLICATION_TIMING
         ]
         
         # Add warnings for high lime amounts
         if lime_caco3 > 4:
-            warnings.append("⚠️ 2 ಟನ್/ಹೆ ಮೊದಲು, ಉಳಿದದ್ದು 6 ತಿಂಗಳ ನಂತರ")
+            warnings.append(WARN_SPLIT_HIGH_LIME)
         
         return LimeResult(
             needs_lime=True,
             lime_required_t_ha=round(lime_caco3, 2),
             product_amount_t_ha=round(product_lime, 2),
-            product_type=self.product[0],
-            product_kannada=self.product[1],
+            product_type=product_type,
+            product_kannada=product_kannada,
             bags_per_acre=bags_per_acre,
-            target_ph=self.target_ph,
-            current_ph=self.soil_ph,
+            target_ph=target_ph,
+            current_ph=soil_ph,
             method_used="buffer_ph",
             confidence="high",
             warnings=warnings,
@@ -219,27 +244,30 @@ class LimeCalculator:
         Based on water pH and soil texture only - less accurate.
         """
         warnings = []
+        product_type, product_kannada, neutralizing_value = self.product
+        soil_ph = self.soil_ph
+        target_ph = self.target_ph
         
         # Check if lime is needed
-        if self.soil_ph >= self.target_ph:
+        if soil_ph >= target_ph:
             return LimeResult(
                 needs_lime=False,
                 lime_required_t_ha=0,
                 product_amount_t_ha=0,
-                product_type=self.product[0],
-                product_kannada=self.product[1],
+                product_type=product_type,
+                product_kannada=product_kannada,
                 bags_per_acre=0,
-                target_ph=self.target_ph,
-                current_ph=self.soil_ph,
+                target_ph=target_ph,
+                current_ph=soil_ph,
                 method_used="empirical",
                 confidence="medium",
-                warnings=["ಸುಣ್ಣ ಅಗತ್ಯವಿಲ್ಲ"],
-                kannada_summary=["✅ ಮಣ್ಣಿನ pH ಸೂಕ್ತವಾಗಿದೆ"]
+                warnings=[MSG_NO_LIME],
+                kannada_summary=[MSG_PH_OK]
             )
         
         # Empirical formula for Udupi lateritic soils
         # Based on local research from KVK Brahmavar
-        ph_deficit = self.target_ph - self.soil_ph
+        ph_deficit = target_ph - soil_ph
         
         # Base calculation (t/ha CaCO3 per pH unit)
         if self.soil_texture in ["clay", "clay_loam"]:
@@ -255,16 +283,16 @@ class LimeCalculator:
         base_lime *= depth_factor(self.depth_cm)
         
         # Calculate product amount
-        product_lime = base_lime * (100 / self.product[2])
+        product_lime = base_lime * (100 / neutralizing_value)
         
         # Bags per acre
         bags_per_acre = int((product_lime * 0.4 * 1000) / 50)
         
-        warnings.append("⚠️ ನಿಖರವಾದ ಲೆಕ್ಕಕ್ಕೆ ಬಫರ್ pH ಪರೀಕ್ಷೆ ಮಾಡಿ")
+        warnings.append(WARN_TEST_BUFFER_PH)
         
         kannada_summary = [
-            f"📊 ಪ್ರಸ್ತುತ pH: {self.soil_ph}, ಗುರಿ pH: {self.target_ph}",
-            f"💊 {self.product[1]}: ಸುಮಾರು {product_lime:.1f} ಟನ್/ಹೆ",
+            f"📊 ಪ್ರಸ್ತುತ pH: {soil_ph}, ಗುರಿ pH: {target_ph}",
+            f"💊 {product_kannada}: ಸುಮಾರು {product_lime:.1f} ಟನ್/ಹೆ",
             f"📦 ಸುಮಾರು {bags_per_acre} ಚೀಲ/ಎಕರೆ (50 ಕೆಜಿ ಚೀಲ)",
         ]
         
@@ -272,11 +300,11 @@ class LimeCalculator:
             needs_lime=True,
             lime_required_t_ha=round(base_lime, 2),
             product_amount_t_ha=round(product_lime, 2),
-            product_type=self.product[0],
-            product_kannada=self.product[1],
+            product_type=product_type,
+            product_kannada=product_kannada,
             bags_per_acre=bags_per_acre,
-            target_ph=self.target_ph,
-            current_ph=self.soil_ph,
+            target_ph=target_ph,
+            current_ph=soil_ph,
             method_used="empirical",
             confidence="medium",
             warnings=warnings,
@@ -194,11 +194,96 @@ MICRONUTRIENT_DOSES = {
 }
 
 
+# Fixed-dose (plantation) crops: crop -> (N, P, K g/plant/year), resolved once
+FIXED_DOSES = {
+    crop: (
+        data.get("n_per_palm", data.get("n_per_vine", 100)),
+        data.get("p_per_palm", data.get("p_per_vine", 40)),
+        data.get("k_per_palm", data.get("k_per_vine", 140)),
+    )
+    for crop, data in CROP_NUTRIENT_UPTAKE.items()
+    if data.get("fixed_dose")
+}
+
+# Fixed-dose reduction by soil status
+FIXED_DOSE_ADJUSTMENT = {"low": 1.0, "medium": 0.75, "high": 0.5}
+
+# Split schedules: (stage, timing, timing_en, urea fraction, full DAP?, MOP fraction)
+SPLIT_PLANS = {
+    "paddy": (
+        ("basal", "ನಾಟಿ ಮಾಡುವಾಗ", "At transplanting", 0.5, True, 0.5),  # Full P at basal
+        ("tillering", "ಪಿಲ್ಲಿ ಬರುವ ಹಂತ (21 DAT)", "Tillering (21 DAT)", 0.25, False, 0),
+        ("panicle", "ತೆನೆ ಬರುವ ಹಂತ (45 DAT)", "Panicle initiation (45 DAT)", 0.25, False, 0.5),
+    ),
+}
+
+# Default 2-split for other crops
+DEFAULT_SPLIT_PLAN = (
+    ("basal", "ಬಿತ್ತನೆ/ನಾಟಿ ಸಮಯದಲ್ಲಿ", "At sowing/planting", 0.5, True, 0.5),
+    ("top_dress", "30-40 ದಿನಗಳ ನಂತರ", "30-40 days after", 0.5, False, 0.5),
+)
+
+# Typical plant density per ha for fixed-dose crops
+PLANTS_PER_HA = {"arecanut": 1100, "coconut": 175, "pepper": 1600}
+
+
 # =============================================================================
 # STCR CALCULATOR CLASS
 # =============================================================================
 
-@dataclass
+def _stcr_kernel(
+    target_yield: float,
+    n_uptake_rate: float,
+    p_uptake_rate: float,
+    k_uptake_rate: float,
+    cs_n: float,
+    cs_p: float,
+    cs_k: float,
+    p_fix: float,
+    n_credit: float,
+    eff_n: float = FERTILIZER_EFFICIENCY["nitrogen"],
+    eff_p: float = FERTILIZER_EFFICIENCY["phosphorus"],
+    eff_k: float = FERTILIZER_EFFICIENCY["potassium"],
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Pure STCR arithmetic on scalars (no dict lookups).
+    Efficiencies default to FERTILIZER_EFFICIENCY, bound once at import.
+    Returns (n_required, p_required, k_required, urea_kg, dap_kg, mop_kg), unrounded.
+    """
+    # Calculate nutrient uptake for target yield
+    n_uptake = target_yield * n_uptake_rate
+    p_uptake = target_yield * p_uptake_rate
+    k_uptake = target_yield * k_uptake_rate
+    
+    # Calculate fertilizer requirement
+    # N = (Total uptake - Soil supply - Credit) / Efficiency
+    n_required = max(0, (n_uptake * (1 - cs_n) - n_credit) / eff_n)
+    
+    # P = (Total uptake - Soil supply) / (Efficiency × (1 - Fixation))
+    p_required = max(0, (p_uptake * (1 - cs_p)) / (eff_p * (1 - p_fix)))
+    
+    # K = (Total uptake - Soil supply) / Efficiency
+    k_required = max(0, (k_uptake * (1 - cs_k)) / eff_k)
+    
+    # Convert to fertilizer products
+    # DAP: 18% N, 46% P2O5
+    # Urea: 46% N
+    # MOP: 60% K2O
+    
+    # Use DAP for P requirement first
+    dap_kg = p_required / 0.46
+    n_from_dap = dap_kg * 0.18
+    
+    # Remaining N from urea
+    urea_kg = max(0, (n_required - n_from_dap) / 0.46)
+    
+    # MOP for K
+    mop_kg = k_required / 0.60
+    
+    return n_required, p_required, k_required, urea_kg, dap_kg, mop_kg
+
+
+@dataclass(slots=True)
 class STCRResult:
     """Result of STCR fertilizer calculation"""
     crop: str
@@ -270,18 +355,15 @@ class STCRCalculator:
         
         self.crop_data = CROP_NUTRIENT_UPTAKE[self.crop]
         
-        # Validate yield target
-        if target_yield < self.crop_data["min_yield"]:
-            self.target_yield = self.crop_data["min_yield"]
-        elif target_yield > self.crop_data["max_yield"]:
-            self.target_yield = self.crop_data["max_yield"]
+        # Validate yield target (clamp to crop range; NaN passes through as before)
+        self.target_yield = min(max(target_yield, self.crop_data["min_yield"]), self.crop_data["max_yield"])
     
     def calculate(self) -> STCRResult:
         """Calculate fertilizer requirement using STCR method"""
         warnings = []
         
         # For plantation crops with fixed doses
-        if self.crop_data.get("fixed_dose"):
+        if self.crop in FIXED_DOSES:
             return self._calculate_fixed_dose()
         
         # Get soil contribution coefficients
@@ -289,46 +371,18 @@ class STCRCalculator:
         cs_p = SOIL_CONTRIBUTION["phosphorus"][self.soil_p_status]
         cs_k = SOIL_CONTRIBUTION["potassium"][self.soil_k_status]
         
-        # Get fertilizer efficiency
-        eff_n = FERTILIZER_EFFICIENCY["nitrogen"]
-        eff_p = FERTILIZER_EFFICIENCY["phosphorus"]
-        eff_k = FERTILIZER_EFFICIENCY["potassium"]
-        
         # Get P fixation factor
         p_fix = P_FIXATION_FACTORS.get(self.soil_type, 0.30)
         
         # Get previous crop credit
         n_credit = PREVIOUS_CROP_CREDITS.get(self.previous_crop, 0)
         
-        # Calculate nutrient uptake for target yield
-        n_uptake = self.target_yield * self.crop_data["n_uptake"]
-        p_uptake = self.target_yield * self.crop_data["p_uptake"]
-        k_uptake = self.target_yield * self.crop_data["k_uptake"]
-        
-        # Calculate fertilizer requirement
-        # N = (Total uptake - Soil supply - Credit) / Efficiency
-        n_required = max(0, (n_uptake * (1 - cs_n) - n_credit) / eff_n)
-        
-        # P = (Total uptake - Soil supply) / (Efficiency × (1 - Fixation))
-        p_required = max(0, (p_uptake * (1 - cs_p)) / (eff_p * (1 - p_fix)))
-        
-        # K = (Total uptake - Soil supply) / Efficiency
-        k_required = max(0, (k_uptake * (1 - cs_k)) / eff_k)
-        
-        # Convert to fertilizer products
-        # DAP: 18% N, 46% P2O5
-        # Urea: 46% N
-        # MOP: 60% K2O
-        
-        # Use DAP for P requirement first
-        dap_kg = p_required / 0.46
-        n_from_dap = dap_kg * 0.18
-        
-        # Remaining N from urea
-        urea_kg = max(0, (n_required - n_from_dap) / 0.46)
-        
-        # MOP for K
-        mop_kg = k_required / 0.60
+        n_required, p_required, k_required, urea_kg, dap_kg, mop_kg = _stcr_kernel(
+            self.target_yield,
+            self.crop_data["n_uptake"], self.crop_data["p_uptake"], self.crop_data["k_uptake"],
+            cs_n, cs_p, cs_k,
+            p_fix, n_credit,
+        )
         
         # Round to practical values
         urea_kg = round(urea_kg, 1)
@@ -376,14 +430,12 @@ class STCRCalculator:
     def _calculate_fixed_dose(self) -> STCRResult:
         """Calculate for plantation crops with fixed dose per plant"""
         # Get fixed doses
-        n_per_plant = self.crop_data.get("n_per_palm", self.crop_data.get("n_per_vine", 100))
-        p_per_plant = self.crop_data.get("p_per_palm", self.crop_data.get("p_per_vine", 40))
-        k_per_plant = self.crop_data.get("k_per_palm", self.crop_data.get("k_per_vine", 140))
+        n_per_plant, p_per_plant, k_per_plant = FIXED_DOSES[self.crop]
         
         # Adjust for soil status
-        n_adj = {"low": 1.0, "medium": 0.75, "high": 0.5}[self.soil_n_status]
-        p_adj = {"low": 1.0, "medium": 0.75, "high": 0.5}[self.soil_p_status]
-        k_adj = {"low": 1.0, "medium": 0.75, "high": 0.5}[self.soil_k_status]
+        n_adj = FIXED_DOSE_ADJUSTMENT[self.soil_n_status]
+        p_adj = FIXED_DOSE_ADJUSTMENT[self.soil_p_status]
+        k_adj = FIXED_DOSE_ADJUSTMENT[self.soil_k_status]
         
         n_required = n_per_plant * n_adj
         p_required = p_per_plant * p_adj
@@ -395,14 +447,7 @@ class STCRCalculator:
         mop_g = k_required / 0.60
         
         # Calculate for typical plant density
-        if self.crop == "arecanut":
-            plants_per_ha = 1100
-        elif self.crop == "coconut":
-            plants_per_ha = 175
-        elif self.crop == "pepper":
-            plants_per_ha = 1600
-        else:
-            plants_per_ha = 1000
+        plants_per_ha = PLANTS_PER_HA.get(self.crop, 1000)
         
         # Total per ha
         total_urea = (urea_g * plants_per_ha) / 1000
@@ -441,48 +486,17 @@ class STCRCalculator:
     
     def _get_splits(self, urea: float, dap: float, mop: float) -> Dict:
         """Get split application schedule for the crop"""
-        if self.crop == "paddy":
-            return {
-                "basal": {
-                    "timing": "ನಾಟಿ ಮಾಡುವಾಗ",
-                    "timing_en": "At transplanting",
-                    "urea_kg": round(urea * 0.5, 1),
-                    "dap_kg": dap,  # Full P at basal
-                    "mop_kg": round(mop * 0.5, 1),
-                },
-                "tillering": {
-                    "timing": "ಪಿಲ್ಲಿ ಬರುವ ಹಂತ (21 DAT)",
-                    "timing_en": "Tillering (21 DAT)",
-                    "urea_kg": round(urea * 0.25, 1),
-                    "dap_kg": 0,
-                    "mop_kg": 0,
-                },
-                "panicle": {
-                    "timing": "ತೆನೆ ಬರುವ ಹಂತ (45 DAT)",
-                    "timing_en": "Panicle initiation (45 DAT)",
-                    "urea_kg": round(urea * 0.25, 1),
-                    "dap_kg": 0,
-                    "mop_kg": round(mop * 0.5, 1),
-                },
-            }
-        else:
-            # Default 2-split for other crops
-            return {
-                "basal": {
-                    "timing": "ಬಿತ್ತನೆ/ನಾಟಿ ಸಮಯದಲ್ಲಿ",
-                    "timing_en": "At sowing/planting",
-                    "urea_kg": round(urea * 0.5, 1),
-                    "dap_kg": dap,
-                    "mop_kg": round(mop * 0.5, 1),
-                },
-                "top_dress": {
-                    "timing": "30-40 ದಿನಗಳ ನಂತರ",
-                    "timing_en": "30-40 days after",
-                    "urea_kg": round(urea * 0.5, 1),
-                    "dap_kg": 0,
-                    "mop_kg": round(mop * 0.5, 1),
-                },
+        return {
+            stage: {
+                "timing": timing,
+                "timing_en": timing_en,
+                "urea_kg": round(urea * urea_frac, 1),
+                "dap_kg": dap if full_dap else 0,
+                "mop_kg": round(mop * mop_frac, 1) if mop_frac else 0,
             }
+            for stage, timing, timing_en, urea_frac, full_dap, mop_frac
+            in SPLIT_PLANS.get(self.crop, DEFAULT_SPLIT_PLAN)
+        }
 
 
 # =============================================================================
@@ -0,0 +1,21 @@
+import os
+
+# Production entrypoint: gunicorn -c gunicorn_conf.py app.app:app
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Import the app (and build GPSResolver + lookup tables) once in the master;
+# forked workers share those pages copy-on-write.
+preload_app = True
+
+# Same 3 workers x 2 threads as before; tune per host via the environment.
+workers = int(os.environ.get("WEB_CONCURRENCY", 3))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 2))
+
+
+def when_ready(server):
+    """Warm the preloaded app in the master so forked workers start warm."""
+    from app.api_logic import warmup
+
+    warmup()
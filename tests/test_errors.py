@@ -1,11 +1,14 @@
 import sys
 import os
 import unittest
+from unittest import mock
 
 # Add root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.api_logic import process_request
+import app.api_logic as api_logic
+from app.api_logic import process_request, process_request_batch, process_request_encoded, _encode_request_cached
+from app.core.farmer_view import parse_sowing_date
 
 class TestErrorHandling(unittest.TestCase):
     
@@ -37,6 +40,83 @@ class TestErrorHandling(unittest.TestCase):
         })
         self.assertEqual(res["status"], "success")
         
+    def test_invalid_optional_zinc(self):
+        """Test garbage zinc_ppm is rejected rather than reported as deficient"""
+        res = process_request({
+            "ph": 5.5, "nitrogen_kg_ha": 300, "phosphorus_kg_ha": 30,
+            "potassium_kg_ha": 200, "crop": "Paddy",
+            "zinc_ppm": "n/a"
+        })
+        self.assertEqual(res.get("error"), "Invalid numeric values in Soil Data")
+
+    def test_non_ymd_sowing_date(self):
+        """Test ISO variants other than YYYY-MM-DD are treated as invalid dates"""
+        for value in ("20240410", "2024-W15-3", "2024-04-10T10:00:00+05:30"):
+            self.assertIsNone(parse_sowing_date(value))
+        self.assertEqual(parse_sowing_date("2024-04-10").month, 4)
+        self.assertEqual(parse_sowing_date("2024-6-5").month, 6)
+
+    def test_batch_invalid_items(self):
+        """Test batch keeps order and flags non-object items"""
+        payload = {"lat": 13.0, "lon": 74.0, "crop": "Paddy"}
+        res = process_request_batch([payload, "bad", {"crop": "Paddy"}, payload])
+        self.assertEqual(res[0]["status"], "success")
+        self.assertEqual(res[1].get("error"), "Invalid request item")
+        self.assertEqual(res[2].get("error"), "Missing Soil Data or GPS Coordinates")
+        self.assertEqual(res[3]["status"], "success")
+        self.assertEqual(res[3], res[0])
+        self.assertIsNot(res[3], res[0])
+
+    def test_batch_bad_crop_item(self):
+        """Test one failing item doesn't fail the rest of the batch"""
+        payload = {"lat": 13.3, "lon": 74.7, "crop": "Paddy"}
+        res = process_request_batch([payload, {"lat": 13.3, "lon": 74.7, "crop": "xyz"}, payload])
+        self.assertEqual(len(res), 3)
+        self.assertEqual(res[0]["status"], "success")
+        self.assertIn("Unknown crop", res[1].get("error", ""))
+        self.assertEqual(res[2]["status"], "success")
+
+    def test_batch_computes_duplicates_once(self):
+        """Test identical batch items run the pipeline once but get independent results"""
+        payload = {"lat": 13.3, "lon": 74.7, "crop": "Paddy"}
+        with mock.patch.object(api_logic, "_process_request", wraps=api_logic._process_request) as pipeline:
+            res = process_request_batch([dict(payload) for _ in range(5)])
+        self.assertEqual(pipeline.call_count, 1)
+        for other in res[1:]:
+            self.assertEqual(other, res[0])
+            self.assertIsNot(other, res[0])
+            self.assertIsNot(other["deficiency_report"], res[0]["deficiency_report"])
+
+    def test_result_mutation_isolated(self):
+        """Test mutating a result doesn't leak into later calls"""
+        payload = {"lat": 13.3, "lon": 74.7, "crop": "Paddy"}
+        first = process_request(payload)
+        first["status"] = "MUTATED"
+        first["deficiency_report"].clear()
+        second = process_request(payload)
+        self.assertEqual(second["status"], "success")
+        self.assertNotEqual(second["deficiency_report"], [])
+
+    def test_encoded_errors_not_cached(self):
+        """Test error payloads get the fixed body and never enter the bytes cache"""
+        before = _encode_request_cached.cache_info().currsize
+        for i in range(3):
+            ok, body = process_request_encoded({"crop": "Paddy", "padding": i})
+            self.assertFalse(ok)
+            self.assertEqual(body, b'{"error":"Missing Soil Data or GPS Coordinates"}')
+        self.assertEqual(_encode_request_cached.cache_info().currsize, before)
+
+    def test_cache_key_ignores_unused_fields(self):
+        """Test padding a payload with unused keys reuses one cache entry"""
+        payload = {"lat": 13.31, "lon": 74.71, "crop": "Paddy"}
+        _, body = process_request_encoded(payload)
+        before = _encode_request_cached.cache_info().currsize
+        for i in range(3):
+            ok, padded = process_request_encoded(dict(payload, padding="x" * 1000, n=i))
+            self.assertTrue(ok)
+            self.assertEqual(padded, body)
+        self.assertEqual(_encode_request_cached.cache_info().currsize, before)
+
     def test_missing_crop(self):
         """Test default crop fallback"""
         res = process_request({"lat": 13.0, "lon": 74.0})
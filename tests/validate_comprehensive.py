@@ -2,7 +2,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # Add root to path
 
-from app.api_logic import process_request
+from app.api_logic import process_request_batch
 
 TEST_CASES = [
     {
@@ -35,8 +35,14 @@ TEST_CASES = [
 print(f"{'TEST CASE':<30} | {'ZONE':<10} | {'TOPO':<10} | {'SOIL':<10} | {'pH':<8} | {'STATUS':<10}")
 print("-" * 90)
 
-for test in TEST_CASES:
-    res = process_request(test["input"])
+# Helper to get EN value safely
+def get_en(val):
+    if isinstance(val, dict): return val.get("en", "").lower()
+    return str(val).lower()
+
+results = process_request_batch([test["input"] for test in TEST_CASES])
+
+for test, res in zip(TEST_CASES, results):
     meta = res["meta"]
     profile = meta["soil_profile"]
     
@@ -44,11 +50,6 @@ for test in TEST_CASES:
     exp = test["expected"]
     passed = True
     
-    # Helper to get EN value safely
-    def get_en(val):
-        if isinstance(val, dict): return val.get("en", "").lower()
-        return str(val).lower()
-    
     zone_val = res["meta"]["zone"] 
     topo_val = res["meta"]["topography"] 
     
@@ -5,6 +5,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.core.gps_resolver import GPSResolver
 
+# (expectation key, profile field, label) - checked in this order
+FIELD_MAP = (
+    ("p", "phosphorus_class", "Phosphorus"),
+    ("k", "potassium_class", "Potassium"),
+    ("texture", "soil_texture_class", "Texture"),
+)
+
 def verify_sync():
     resolver = GPSResolver()
     
@@ -33,32 +40,15 @@ def verify_sync():
             
         print(f"Checking {taluk}...")
         
-        # Check P
-        if "p" in rules:
-            actual = data.get("phosphorus_class")
-            if actual != rules["p"]:
-                print(f"  ❌ Phosphorus Mismatch! Expected: {rules['p']}, Got: {actual}")
-                all_pass = False
-            else:
-                print(f"  ✅ Phosphorus: {actual}")
-                
-        # Check K
-        if "k" in rules:
-            actual = data.get("potassium_class")
-            if actual != rules["k"]:
-                print(f"  ❌ Potassium Mismatch! Expected: {rules['k']}, Got: {actual}")
-                all_pass = False
-            else:
-                print(f"  ✅ Potassium: {actual}")
-                
-        # Check Texture
-        if "texture" in rules:
-            actual = data.get("soil_texture_class")
-            if actual != rules["texture"]:
-                print(f"  ❌ Texture Mismatch! Expected: {rules['texture']}, Got: {actual}")
+        for rule, field, label in FIELD_MAP:
+            if rule not in rules:
+                continue
+            actual = data.get(field)
+            if actual != rules[rule]:
+                print(f"  ❌ {label} Mismatch! Expected: {rules[rule]}, Got: {actual}")
                 all_pass = False
             else:
-                print(f"  ✅ Texture: {actual}")
+                print(f"  ✅ {label}: {actual}")
                 
     if all_pass:
         print("-" * 50)